@@ -0,0 +1,57 @@
+from array import array
+
+
+class DisjointSet:
+    """Union-find over the dense ints `0..size-1`.
+
+    - `parent` and `sizes` are `array("q")` slabs, like `ArrayLinkedList`.
+    - `find` is iterative with path halving (every visited node is pointed
+      at its grandparent), so long chains never recurse.
+    - `union` hangs the smaller tree under the larger one. Together with
+      path halving that gives near-constant amortized operations.
+    - `add` appends a new singleton, so the universe can grow.
+    """
+
+    def __init__(self, size: int = 0):
+        self.parent = array("q", range(size))
+        self.sizes = array("q", [1]) * size
+        self.components = size
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self) -> int:
+        """Add a new singleton set and return its element."""
+        element = len(self.parent)
+        self.parent.append(element)
+        self.sizes.append(1)
+        self.components += 1
+        return element
+
+    def find(self, x: int) -> int:
+        """Return the representative of the set containing `x`."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of `a` and `b`; False if they were already one set."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        sizes = self.sizes
+        if sizes[root_a] < sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        sizes[root_a] += sizes[root_b]
+        self.components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def set_size(self, x: int) -> int:
+        """Number of elements in the set containing `x`."""
+        return self.sizes[self.find(x)]
@@ -0,0 +1,71 @@
+from array import array
+from typing import Iterable, Optional
+
+
+class CSRGraph:
+    """Directed weighted graph in compressed sparse row (CSR) form.
+
+    - Nodes are dense ints `0..num_nodes-1`; `nodes[i]` is the original
+      node id and `index` maps an id back to its int.
+    - The out-edges of node `i` are `targets[offsets[i]:offsets[i + 1]]`,
+      with matching entries in `weights`.
+    - `offsets` and `targets` are `array("q")`; `weights` is `array("q")`
+      when every weight is an int and `array("d")` otherwise. That is about
+      16 bytes per edge instead of a tuple and two boxed numbers.
+    """
+
+    def __init__(self, offsets: array, targets: array, weights: array, nodes: Optional[list] = None):
+        if len(targets) != len(weights) or len(offsets) == 0 or offsets[-1] != len(targets):
+            raise ValueError("offsets, targets and weights do not describe the same edges")
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.nodes = list(range(len(offsets) - 1)) if nodes is None else nodes
+        if len(self.nodes) != len(offsets) - 1:
+            raise ValueError("need one node id per offsets entry")
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+
+    @classmethod
+    def from_adjacency(cls, graph: dict):
+        """Build from `{node: [(neighbor, weight), ...]}`, the format `dijkstra` takes.
+
+        Nodes keep the dict's order; neighbors that are not keys are appended
+        as nodes without out-edges.
+        """
+        nodes = list(graph)
+        index = {node: i for i, node in enumerate(nodes)}
+        offsets = array("q", [0])
+        targets = array("q")
+        weight_list = []
+        for edges in graph.values():
+            for neighbor, weight in edges:
+                target = index.get(neighbor)
+                if target is None:
+                    target = index[neighbor] = len(nodes)
+                    nodes.append(neighbor)
+                targets.append(target)
+                weight_list.append(weight)
+            offsets.append(len(targets))
+        offsets.extend([len(targets)] * (len(nodes) - len(graph)))
+        typecode = "q" if all(type(w) is int for w in weight_list) else "d"
+        return cls(offsets, targets, array(typecode, weight_list), nodes)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def neighbors(self, i: int) -> Iterable:
+        """Yield `(target, weight)` for the out-edges of dense node `i`."""
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def to_labels(self, values) -> dict:
+        """Turn a per-dense-node list (e.g. distances) into `{node id: value}`."""
+        return dict(zip(self.nodes, values))
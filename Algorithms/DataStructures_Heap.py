@@ -1,32 +1,351 @@
-clsas Heap:
-
-    def __init__(self):
-        self.data = [] 
-        self.size = 0
-        self.type = "min"  # or "max"
-    
-    def insert(self, value):
+from itertools import islice
+import operator
+
+
+class Heap:
+    """Array-backed binary heap.
+
+    - `heap_type` is "min" or "max". The comparison (`operator.lt` or
+      `operator.gt`) is picked once here instead of branching on the type
+      at every sift step.
+    - `key` orders values by `key(value)`. Keys are computed once per value
+      and kept in the parallel list `_keys`; without a key function `_keys`
+      is simply `data` itself.
+    - Sifting is iterative and moves a hole instead of swapping, so each
+      level costs one comparison and two stores.
+    - `heapify(iterable)` bulk-loads in O(n); `push`/`pop`/`pushpop`/
+      `replace` are O(log n) and `peek` is O(1).
+    """
+
+    def __init__(self, iterable=None, heap_type="min", key=None):
+        if heap_type == "min":
+            self._before = operator.lt
+        elif heap_type == "max":
+            self._before = operator.gt
+        else:
+            raise ValueError("heap_type must be 'min' or 'max'")
+        self.type = heap_type
+        self.key = key
+        self.data = []
+        self._keys = [] if key is not None else self.data
+        if iterable is not None:
+            self.heapify(iterable)
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def heapify(self, iterable):
+        """Add every value from `iterable` and restore heap order in O(n)."""
+        start = len(self.data)
+        self.data.extend(iterable)
+        if self.key is not None:
+            key = self.key
+            self._keys.extend(key(value) for value in self.data[start:])
+        for index in range(len(self.data) // 2 - 1, -1, -1):
+            self._sift_down(index)
+
+    def push(self, value):
         """Insert value into the heap."""
         self.data.append(value)
-        self.size += 1
-        self._heapify_up(self.size - 1)
-    
-    def _heapify_up(self, index):
-        """Maintain heap property by moving the element at index up."""
-        parent_index = (index - 1) // 2
-        if index > 0:
-            if (self.type == "min" and self.data[index] < self.data[parent_index]) or \
-               (self.type == "max" and self.data[index] > self.data[parent_index]):
-                self.data[index], self.data[parent_index] = self.data[parent_index], self.data[index]
-                self._heapify_up(parent_index)
-    def _heapify_down(self, index):
-        """Maintain heap property by moving the element at index down."""
-        left_child_index = 2 * index + 1
-        right_child_index = 2 * index + 2
-        smallest_largest = index
-
-        if left_child_index < self.size:
-            if (self.type == "min" and self.data[left_child_index] < self.data[smallest_largest]) or \
-               (self.type == "max" and self.data[left_child_index] > self.data[smallest_largest]):
-                smallest_largest = left_child_index
-                
\ No newline at end of file
+        if self.key is not None:
+            self._keys.append(self.key(value))
+        self._sift_up(len(self.data) - 1)
+
+    insert = push
+
+    def peek(self):
+        """Return the top value without removing it."""
+        if not self.data:
+            raise IndexError("peek from empty heap")
+        return self.data[0]
+
+    def pop(self):
+        """Remove and return the top value."""
+        data = self.data
+        if not data:
+            raise IndexError("pop from empty heap")
+        last = data.pop()
+        last_key = self._keys.pop() if self.key is not None else last
+        if not data:
+            return last
+        top = data[0]
+        data[0] = last
+        self._keys[0] = last_key
+        self._sift_down(0)
+        return top
+
+    def pushpop(self, value):
+        """Push `value` then pop the top, faster than calling both."""
+        key = self.key(value) if self.key is not None else value
+        if not self.data or not self._before(self._keys[0], key):
+            return value
+        top = self.data[0]
+        self.data[0] = value
+        self._keys[0] = key
+        self._sift_down(0)
+        return top
+
+    def replace(self, value):
+        """Pop the top then push `value`; the result may be larger than `value`."""
+        if not self.data:
+            raise IndexError("replace on empty heap")
+        top = self.data[0]
+        self.data[0] = value
+        self._keys[0] = self.key(value) if self.key is not None else value
+        self._sift_down(0)
+        return top
+
+    # When `_keys is data` the paired stores below write the same slot
+    # twice; that keeps a single code path for both modes.
+    def _sift_up(self, index):
+        """Move the value at index up until its parent does not come after it."""
+        data, keys, before = self.data, self._keys, self._before
+        value, key = data[index], keys[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_key = keys[parent]
+            if not before(key, parent_key):
+                break
+            data[index] = data[parent]
+            keys[index] = parent_key
+            index = parent
+        data[index] = value
+        keys[index] = key
+
+    def _sift_down(self, index):
+        """Move the value at index down until no child comes before it."""
+        data, keys, before = self.data, self._keys, self._before
+        size = len(data)
+        value, key = data[index], keys[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size and before(keys[right], keys[child]):
+                child = right
+            child_key = keys[child]
+            if not before(child_key, key):
+                break
+            data[index] = data[child]
+            keys[index] = child_key
+            index = child
+            child = 2 * index + 1
+        data[index] = value
+        keys[index] = key
+
+
+class IndexedHeap:
+    """Min-heap of unique, hashable items with changeable priorities.
+
+    - Items and priorities live in the parallel lists `data` and `_keys`
+      (as in `Heap`); `_pos` maps each item to its slot, kept current by
+      every sift.
+    - `contains` / `priority` are O(1); `push`, `pop`, `decrease_key`,
+      `increase_key` and `remove` are O(log n). A priority update moves the
+      existing entry, so the heap never holds more than one entry per item.
+    """
+
+    def __init__(self, iterable=None):
+        """`iterable` yields (item, priority) pairs, bulk-loaded in O(n)."""
+        self.data = []
+        self._keys = []
+        self._pos = {}
+        if iterable is not None:
+            for item, priority in iterable:
+                if item in self._pos:
+                    raise ValueError("item already in heap")
+                self._pos[item] = len(self.data)
+                self.data.append(item)
+                self._keys.append(priority)
+            for index in range(len(self.data) // 2 - 1, -1, -1):
+                self._sift_down(index)
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, item):
+        return item in self._pos
+
+    def contains(self, item) -> bool:
+        return item in self._pos
+
+    def priority(self, item):
+        """Current priority of `item`; KeyError if it is not in the heap."""
+        return self._keys[self._pos[item]]
+
+    def push(self, item, priority):
+        """Add `item`; ValueError if it is already present."""
+        if item in self._pos:
+            raise ValueError("item already in heap")
+        self.data.append(item)
+        self._keys.append(priority)
+        self._sift_up(len(self.data) - 1)
+
+    def peek(self):
+        """Return the (item, priority) pair with the smallest priority."""
+        if not self.data:
+            raise IndexError("peek from empty heap")
+        return self.data[0], self._keys[0]
+
+    def pop(self):
+        """Remove and return the (item, priority) pair with the smallest priority."""
+        if not self.data:
+            raise IndexError("pop from empty heap")
+        item, priority = self.data[0], self._keys[0]
+        self._remove_at(0)
+        return item, priority
+
+    def remove(self, item):
+        """Remove `item` from anywhere in the heap and return its priority."""
+        index = self._pos[item]
+        priority = self._keys[index]
+        self._remove_at(index)
+        return priority
+
+    def decrease_key(self, item, priority):
+        """Lower the priority of `item` (ValueError if `priority` is larger)."""
+        index = self._pos[item]
+        if self._keys[index] < priority:
+            raise ValueError("new priority is larger than the current one")
+        self._keys[index] = priority
+        self._sift_up(index)
+
+    def increase_key(self, item, priority):
+        """Raise the priority of `item` (ValueError if `priority` is smaller)."""
+        index = self._pos[item]
+        if priority < self._keys[index]:
+            raise ValueError("new priority is smaller than the current one")
+        self._keys[index] = priority
+        self._sift_down(index)
+
+    def _remove_at(self, index):
+        data, keys = self.data, self._keys
+        del self._pos[data[index]]
+        last = data.pop()
+        last_key = keys.pop()
+        if index == len(data):
+            return
+        removed_key = keys[index]
+        data[index] = last
+        keys[index] = last_key
+        if last_key < removed_key:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def _sift_up(self, index):
+        data, keys, pos = self.data, self._keys, self._pos
+        item, key = data[index], keys[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            parent_key = keys[parent]
+            if not key < parent_key:
+                break
+            moved = data[parent]
+            data[index] = moved
+            keys[index] = parent_key
+            pos[moved] = index
+            index = parent
+        data[index] = item
+        keys[index] = key
+        pos[item] = index
+
+    def _sift_down(self, index):
+        data, keys, pos = self.data, self._keys, self._pos
+        size = len(data)
+        item, key = data[index], keys[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size and keys[right] < keys[child]:
+                child = right
+            child_key = keys[child]
+            if not child_key < key:
+                break
+            moved = data[child]
+            data[index] = moved
+            keys[index] = child_key
+            pos[moved] = index
+            index = child
+            child = 2 * index + 1
+        data[index] = item
+        keys[index] = key
+        pos[item] = index
+
+
+class TopK:
+    """Bounded heap that keeps the k smallest (or, with `largest=True`, the
+    k largest) values seen so far.
+
+    - Holds a `Heap` of at most k values whose top is the current worst
+      kept value, so each new value costs one comparison when rejected and
+      O(log k) when kept: O(n log k) time and O(k) memory for n values.
+    - `merge` folds in other TopK objects or plain iterables (e.g. the
+      `result()` lists of per-chunk workers); the merged answer equals the
+      one computed over all the inputs at once, provided every part kept at
+      least k values with the same `largest` and an equivalent `key`.
+    """
+
+    def __init__(self, k: int, key=None, largest: bool = False, iterable=None):
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self.k = k
+        self.key = key
+        self.largest = largest
+        # Worst kept value on top: a max-heap for the smallest, and vice versa.
+        self._heap = Heap(heap_type="min" if largest else "max", key=key)
+        if iterable is not None:
+            self.extend(iterable)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, value):
+        """Offer one value."""
+        heap = self._heap
+        if len(heap) < self.k:
+            heap.push(value)
+        elif self.k:
+            heap.pushpop(value)
+
+    def extend(self, iterable):
+        """Offer every value from `iterable`."""
+        heap = self._heap
+        iterator = iter(iterable)
+        missing = self.k - len(heap)
+        if missing > 0:
+            heap.heapify(islice(iterator, missing))
+        if not self.k:
+            return
+        pushpop = heap.pushpop
+        for value in iterator:
+            pushpop(value)
+
+    def merge(self, *parts):
+        """Fold in other `TopK` objects or iterables of values; returns self.
+
+        A `TopK` part must have `k >= self.k` and the same `largest`,
+        otherwise it has already dropped values the merged answer needs;
+        such parts raise ValueError. Its `key` must order values the same
+        way as `self.key`. It need not be the same object (a part unpickled
+        from a worker process carries a copy), since values are re-keyed
+        with `self.key` on the way in. Plain iterables are taken as is.
+        """
+        for part in parts:
+            if isinstance(part, TopK):
+                if part.k < self.k or part.largest != self.largest:
+                    raise ValueError("TopK part needs k >= self.k and the same largest")
+                part = part._heap.data
+            self.extend(part)
+        return self
+
+    def result(self) -> list:
+        """The kept values, best first (ascending, or descending if `largest`)."""
+        return sorted(self._heap.data, key=self.key, reverse=self.largest)
@@ -1,20 +1,96 @@
-from DataStructures_Nodes import SingleLinkedListNode, DoublyLinkedListNode
+from array import array
+from collections import deque
+from itertools import islice
+from DataStructures_Nodes import SingleLinkedListNode, DoublyLinkedListNode, detectLoop
+from DataStructures_SkipLists import IndexableSkipList
+
+
+class LinkedListSlice:
+    """Read-only, zero-copy view of `length` consecutive nodes from `first`.
+
+    Returned by `LinkedList.slice` / `DoublyLinkedList.slice`. It follows
+    `.next` lazily, so it is only meaningful while the viewed range of the
+    source list is left intact.
+    """
+
+    __slots__ = ("first", "length")
+
+    def __init__(self, first, length):
+        self.first = first
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        node = self.first
+        for _ in range(self.length):
+            yield node.payload
+            node = node.next
+
+    def __str__(self):
+        return " -> ".join(str(item) for item in self) if self.length else "None"
 
 
 class LinkedList:
-    def __init__(self, iterable=None):
+    NodeType = SingleLinkedListNode
+
+    def __init__(self, iterable=None, node_type=None, indexed=False):
         """Simple singly-linked list implementation.
 
         - Indexing and insertion/deletion operations are 1-based where noted.
         - Methods: insert_at_head, insert_at_tail, insert_at(index),
-          delete_at_head, delete_at_tail, delete_at(index), delete_value(value)
+          delete_at_head, delete_at_tail, delete_at(index), delete_value(value),
+          node_at(index), get(index)
+        - `node_type` selects the node class, e.g.
+          `SlottedSingleLinkedListNode` for the `__slots__` fast path.
+        - `indexed=True` maintains an `IndexableSkipList` of the nodes so
+          positional access, `insert_at` and `delete_at` are O(log n)
+          instead of walking from the head.
+        - Deque-style API: append, appendleft, pop, popleft, extend,
+          extendleft. All are O(1) (amortized for `pop`) per element.
+          Tail removal uses a lazily built "spine" (a `deque` of the nodes),
+          created on the first tail delete and kept in sync by head/tail
+          operations. Middle edits drop it, so lists that never pop from
+          the tail keep a plain singly-linked footprint.
         """
+        if node_type is not None:
+            self.NodeType = node_type
         self.head = None
         self.tail = None
         self.size = 0
+        self._index = None
+        self._spine = None
         if iterable:
-            for item in iterable:
-                self.insert_at_tail(item)
+            self.extend(iterable)
+        if indexed:
+            self._index = IndexableSkipList(self._iter_nodes())
+
+    @property
+    def indexed(self) -> bool:
+        return self._index is not None
+
+    def _iter_nodes(self):
+        """Yield the `size` nodes in order (safe on looped `from_head` views)."""
+        node = self.head
+        for _ in range(self.size):
+            yield node
+            node = node.next
+
+    def node_at(self, index):
+        """Return the node at 1-based `index`."""
+        if index < 1 or index > self.size:
+            raise IndexError("Index out of bounds")
+        if self._index is not None:
+            return self._index.get(index)
+        node = self.head
+        for _ in range(1, index):
+            node = node.next
+        return node
+
+    def get(self, index):
+        """Return the payload at 1-based `index`."""
+        return self.node_at(index).payload
 
     def __len__(self):
         return self.size
@@ -23,28 +99,48 @@ class LinkedList:
         node = self.head
         while node:
             yield node.payload
-            node = node.Next()
+            node = node.next
 
     def __str__(self):
         return self.head.strChain() if self.head else "None"
 
+    def iter_text(self, max_items=None):
+        """Yield `str(self)` in chunks; `max_items` elides the middle (see `iterChain`)."""
+        if self.head is None:
+            yield "None"
+            return
+        yield from self.head.iterChain(max_items)
+
+    def write(self, stream, max_items=None):
+        """Stream `str(self)` to a file-like object without building the string."""
+        for chunk in self.iter_text(max_items):
+            stream.write(chunk)
+
     # Insertions
     def insert_at_head(self, value):
-        new_node = SingleLinkedListNode(value)
-        new_node.Next(self.head)
+        new_node = self.NodeType(value)
+        new_node.next = self.head
         self.head = new_node
         if self.tail is None:
             self.tail = new_node
         self.size += 1
+        if self._index is not None:
+            self._index.insert(1, new_node)
+        if self._spine is not None:
+            self._spine.appendleft(new_node)
 
     def insert_at_tail(self, value):
-        new_node = SingleLinkedListNode(value)
+        new_node = self.NodeType(value)
         if self.tail:
-            self.tail.Next(new_node)
+            self.tail.next = new_node
         else:
             self.head = new_node
         self.tail = new_node
         self.size += 1
+        if self._index is not None:
+            self._index.append(new_node)
+        if self._spine is not None:
+            self._spine.append(new_node)
 
     def insert_at(self, index, value):
         """Insert value at 1-based index. index==1 inserts at head; index==size+1 appends."""
@@ -55,51 +151,64 @@ class LinkedList:
         if index == self.size + 1:
             return self.insert_at_tail(value)
 
-        new_node = SingleLinkedListNode(value)
-        prev = self.head
-        for _ in range(1, index - 1):
-            prev = prev.Next()
-        new_node.Next(prev.Next())
-        prev.Next(new_node)
+        new_node = self.NodeType(value)
+        prev = self.node_at(index - 1)
+        new_node.next = prev.next
+        prev.next = new_node
         self.size += 1
+        if self._index is not None:
+            self._index.insert(index, new_node)
+        self._spine = None
 
     # Deletions
     def delete_at_head(self):
         if not self.head:
             raise IndexError("Delete from empty list")
-        self.head = self.head.Next()
+        self.head = self.head.next
         if not self.head:
             self.tail = None
         self.size -= 1
+        if self._index is not None:
+            self._index.delete(1)
+        if self._spine is not None:
+            self._spine.popleft()
 
     def delete_at_tail(self):
         if self.size == 0:
             raise IndexError("Delete from empty list")
         if self.size == 1:
-            self.head = None
-            self.tail = None
-            self.size = 0
-            return
-        prev = self.head
-        while prev.Next() is not self.tail:
-            prev = prev.Next()
-        prev.Next(None)
+            return self.delete_at_head()
+        if self._index is not None:
+            # The skip list already finds the new tail in O(log n); a spine
+            # would only duplicate it.
+            prev = self._index.get(self.size - 1)
+            if self._spine is not None:
+                self._spine.pop()
+        else:
+            if self._spine is None:
+                self._spine = deque(self._iter_nodes())
+            self._spine.pop()
+            prev = self._spine[-1]
+        prev.next = None
         self.tail = prev
         self.size -= 1
+        if self._index is not None:
+            self._index.delete(self.size + 1)
 
     def delete_at(self, index):
         if index < 1 or index > self.size:
             raise IndexError("Index out of bounds")
         if index == 1:
             return self.delete_at_head()
-        prev = self.head
-        for _ in range(1, index - 1):
-            prev = prev.Next()
-        to_delete = prev.Next()
-        prev.Next(to_delete.Next())
+        prev = self.node_at(index - 1)
+        to_delete = prev.next
+        prev.next = to_delete.next
         if to_delete is self.tail:
             self.tail = prev
         self.size -= 1
+        if self._index is not None:
+            self._index.delete(index)
+        self._spine = None
 
     def delete_value(self, value):
         """Delete the first node that equals value. Returns True if deleted."""
@@ -111,48 +220,206 @@ class LinkedList:
                 if prev is None:
                     self.delete_at_head()
                 else:
-                    prev.Next(node.Next())
+                    prev.next = node.next
                     if node is self.tail:
                         self.tail = prev
                     self.size -= 1
+                    if self._index is not None:
+                        self._index.delete(idx)
+                    self._spine = None
                 return True
             prev = node
-            node = node.Next()
+            node = node.next
             idx += 1
         return False
 
+    # Deque-style API
+    append = insert_at_tail
+    appendleft = insert_at_head
+
+    def pop(self):
+        """Remove and return the last payload (amortized O(1); O(log n) when indexed)."""
+        if self.size == 0:
+            raise IndexError("pop from empty list")
+        value = self.tail.payload
+        self.delete_at_tail()
+        return value
+
+    def popleft(self):
+        """Remove and return the first payload."""
+        if self.size == 0:
+            raise IndexError("pop from empty list")
+        value = self.head.payload
+        self.delete_at_head()
+        return value
+
+    def _build_nodes(self, iterable) -> list:
+        """Create and link nodes for `iterable` (in order); return them."""
+        NodeType = self.NodeType
+        nodes = [NodeType(item) for item in iterable]
+        for i in range(1, len(nodes)):
+            nodes[i - 1].next = nodes[i]
+        return nodes
+
+    def extend(self, iterable):
+        """Append every item, linking the new chain onto the tail in one splice."""
+        nodes = self._build_nodes(iterable)
+        if not nodes:
+            return
+        if self.tail is not None:
+            self.tail.next = nodes[0]
+        else:
+            self.head = nodes[0]
+        self.tail = nodes[-1]
+        self.size += len(nodes)
+        if self._index is not None:
+            for node in nodes:
+                self._index.append(node)
+        if self._spine is not None:
+            self._spine.extend(nodes)
+
+    def extendleft(self, iterable):
+        """Prepend every item one by one, like `deque.extendleft` (order ends up reversed)."""
+        nodes = self._build_nodes(reversed(list(iterable)))
+        if not nodes:
+            return
+        nodes[-1].next = self.head
+        if self.tail is None:
+            self.tail = nodes[-1]
+        self.head = nodes[0]
+        self.size += len(nodes)
+        if self._index is not None:
+            for node in reversed(nodes):
+                self._index.insert(1, node)
+        if self._spine is not None:
+            self._spine.extendleft(reversed(nodes))
+
+    # Bulk relinking: nodes move between lists, payloads are never copied
+    def _take_all(self, other):
+        """Detach every node of `other`; return (head, tail, size) and leave it empty."""
+        if not isinstance(other, LinkedList):
+            raise TypeError("Can only splice a LinkedList into a LinkedList")
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        chain = (other.head, other.tail, other.size)
+        other.head = None
+        other.tail = None
+        other.size = 0
+        other._spine = None
+        if other._index is not None:
+            other._index = IndexableSkipList()
+        return chain
+
+    def splice(self, other, at):
+        """Move all nodes of `other` in so its first element lands at 1-based `at`.
+
+        Only the two boundary links change; locating position `at` costs
+        one `node_at` (O(1) for `at` of 1 or size + 1). `other` is left
+        empty. Indexed lists also add the k moved nodes to their index.
+        """
+        if at < 1 or at > self.size + 1:
+            raise IndexError("Index out of bounds")
+        appending = at == self.size + 1
+        prev = None if at == 1 else (self.tail if appending else self.node_at(at - 1))
+        head, tail, count = self._take_all(other)
+        if count == 0:
+            return
+        if prev is None:
+            tail.next = self.head
+            self.head = head
+        else:
+            tail.next = prev.next
+            prev.next = head
+        if appending:
+            self.tail = tail
+        if self._index is not None:
+            node = head
+            for offset in range(count):
+                self._index.insert(at + offset, node)
+                node = node.next
+        self.size += count
+        self._spine = None
+
+    def concat(self, other):
+        """Move all nodes of `other` onto the end of this list in O(1)."""
+        self.splice(other, self.size + 1)
+
+    def split_at(self, index):
+        """Keep the first `index` elements and return a new list holding the rest.
+
+        The boundary is found with `node_at`; no nodes are copied.
+        """
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of bounds")
+        rest = type(self)(node_type=self.NodeType)
+        moved = self.size - index
+        if moved == 0:
+            if self._index is not None:
+                rest._index = IndexableSkipList()
+            return rest
+        if index == 0:
+            rest.head = self.head
+            self.head = None
+            new_tail = None
+        else:
+            new_tail = self.node_at(index)
+            rest.head = new_tail.next
+            new_tail.next = None
+        rest.tail = self.tail
+        rest.size = moved
+        self.tail = new_tail
+        self.size = index
+        self._spine = None
+        if self._index is not None:
+            rest._index = IndexableSkipList(rest._iter_nodes())
+            if moved > index:
+                self._index = IndexableSkipList(self._iter_nodes())
+            else:
+                for position in range(index + moved, index, -1):
+                    self._index.delete(position)
+        return rest
+
+    def slice(self, start, stop):
+        """Zero-copy view of 1-based positions `start` .. `stop - 1` (half-open, like `range`)."""
+        if start < 1 or stop < start or stop > self.size + 1:
+            raise IndexError("Index out of bounds")
+        return LinkedListSlice(self.node_at(start) if stop > start else None, stop - start)
+
+    def reverse(self):
+        """Reverse the list in place by relinking its nodes."""
+        prev = None
+        node = self.head
+        for _ in range(self.size):
+            nxt = node.next
+            node.next = prev
+            prev = node
+            node = nxt
+        self.head, self.tail = self.tail, self.head
+        if self._index is not None:
+            self._index = IndexableSkipList(self._iter_nodes())
+        if self._spine is not None:
+            self._spine.reverse()
+
     @classmethod
-    def from_head(cls, head_node):
+    def from_head(cls, head_node, indexed=False, loop_detection="brent"):
         """Construct a LinkedList view from an existing head node.
 
-        - Traverses nodes using `Next()` to determine `tail` and `size`.
+        - Traverses nodes using `.next` to determine `tail` and `size`.
         - Handles cycles: counts each unique node once and sets `tail`
           to the last unique node before the cycle repeats (or None if empty).
+          `loop_detection` picks the detector (see `detectLoop`); the
+          default uses O(1) extra memory.
+        - `indexed=True` builds the positional index over the view.
         """
-        inst = cls()
+        inst = cls(node_type=type(head_node) if head_node is not None else None)
         inst.head = head_node
-        if head_node is None:
-            inst.tail = None
-            inst.size = 0
-            return inst
-
-        seen = {}
-        node = head_node
-        prev = None
-        while node is not None:
-            nid = id(node)
-            if nid in seen:
-                # cycle detected; prev is last unique node
-                inst.tail = prev
-                inst.size = len(seen)
-                return inst
-            seen[nid] = node
-            prev = node
-            node = node.Next()
-
-        # reached end (no cycle)
-        inst.tail = prev
-        inst.size = len(seen)
+        inst.size, _loopIndex = detectLoop(head_node, loop_detection)
+        tail = head_node
+        for _ in range(inst.size - 1):
+            tail = tail.next
+        inst.tail = tail
+        if indexed:
+            inst._index = IndexableSkipList(inst._iter_nodes())
         return inst
 
 
@@ -162,14 +429,39 @@ class DoublyLinkedList:
     API mirrors `LinkedList`: `insert_at_head`, `insert_at_tail`, `insert_at`,
     `delete_at_head`, `delete_at_tail`, `delete_at`, `delete_value`, iteration
     and `__str__` (with loop detection).
+
+    `node_type` selects the node class, e.g. `SlottedDoublyLinkedListNode`.
+    The deque-style API (append, appendleft, pop, popleft, extend,
+    extendleft) is O(1) per element at both ends.
     """
-    def __init__(self, iterable=None):
+    NodeType = DoublyLinkedListNode
+
+    def __init__(self, iterable=None, node_type=None):
+        if node_type is not None:
+            self.NodeType = node_type
         self.head = None
         self.tail = None
         self.size = 0
         if iterable:
-            for item in iterable:
-                self.insert_at_tail(item)
+            self.extend(iterable)
+
+    def node_at(self, index):
+        """Return the node at 1-based `index`, walking from the closer end."""
+        if index < 1 or index > self.size:
+            raise IndexError("Index out of bounds")
+        if index <= (self.size + 1) // 2:
+            node = self.head
+            for _ in range(1, index):
+                node = node.next
+        else:
+            node = self.tail
+            for _ in range(index, self.size):
+                node = node.prev
+        return node
+
+    def get(self, index):
+        """Return the payload at 1-based `index`."""
+        return self.node_at(index).payload
 
     def __len__(self):
         return self.size
@@ -178,27 +470,39 @@ class DoublyLinkedList:
         node = self.head
         while node:
             yield node.payload
-            node = node.Next()
+            node = node.next
 
     def __str__(self):
         return self.head.strChain() if self.head else "None"
 
+    def iter_text(self, max_items=None):
+        """Yield `str(self)` in chunks; `max_items` elides the middle (see `iterChain`)."""
+        if self.head is None:
+            yield "None"
+            return
+        yield from self.head.iterChain(max_items)
+
+    def write(self, stream, max_items=None):
+        """Stream `str(self)` to a file-like object without building the string."""
+        for chunk in self.iter_text(max_items):
+            stream.write(chunk)
+
     # Insertions
     def insert_at_head(self, value):
-        new_node = DoublyLinkedListNode(value)
-        new_node.Next(self.head)
+        new_node = self.NodeType(value)
+        new_node.next = self.head
         if self.head:
-            self.head.Previous(new_node)
+            self.head.prev = new_node
         self.head = new_node
         if self.tail is None:
             self.tail = new_node
         self.size += 1
 
     def insert_at_tail(self, value):
-        new_node = DoublyLinkedListNode(value)
+        new_node = self.NodeType(value)
         if self.tail:
-            self.tail.Next(new_node)
-            new_node.Previous(self.tail)
+            self.tail.next = new_node
+            new_node.prev = self.tail
         else:
             self.head = new_node
         self.tail = new_node
@@ -212,26 +516,24 @@ class DoublyLinkedList:
         if index == self.size + 1:
             return self.insert_at_tail(value)
 
-        new_node = DoublyLinkedListNode(value)
-        prev = self.head
-        for _ in range(1, index - 1):
-            prev = prev.Next()
-        nxt = prev.Next()
-        prev.Next(new_node)
-        new_node.Previous(prev)
-        new_node.Next(nxt)
+        new_node = self.NodeType(value)
+        prev = self.node_at(index - 1)
+        nxt = prev.next
+        prev.next = new_node
+        new_node.prev = prev
+        new_node.next = nxt
         if nxt:
-            nxt.Previous(new_node)
+            nxt.prev = new_node
         self.size += 1
 
     # Deletions
     def delete_at_head(self):
         if not self.head:
             raise IndexError("Delete from empty list")
-        nxt = self.head.Next()
+        nxt = self.head.next
         self.head = nxt
         if self.head:
-            self.head.Previous(None)
+            self.head.prev = None
         else:
             self.tail = None
         self.size -= 1
@@ -244,8 +546,8 @@ class DoublyLinkedList:
             self.tail = None
             self.size = 0
             return
-        prev = self.tail.Previous()
-        prev.Next(None)
+        prev = self.tail.prev
+        prev.next = None
         self.tail = prev
         self.size -= 1
 
@@ -256,14 +558,12 @@ class DoublyLinkedList:
             return self.delete_at_head()
         if index == self.size:
             return self.delete_at_tail()
-        prev = self.head
-        for _ in range(1, index - 1):
-            prev = prev.Next()
-        to_delete = prev.Next()
-        nxt = to_delete.Next()
-        prev.Next(nxt)
+        prev = self.node_at(index - 1)
+        to_delete = prev.next
+        nxt = to_delete.next
+        prev.next = nxt
         if nxt:
-            nxt.Previous(prev)
+            nxt.prev = prev
         self.size -= 1
 
     def delete_value(self, value):
@@ -274,55 +574,435 @@ class DoublyLinkedList:
                 if prev is None:
                     self.delete_at_head()
                 else:
-                    nxt = node.Next()
-                    prev.Next(nxt)
+                    nxt = node.next
+                    prev.next = nxt
                     if nxt:
-                        nxt.Previous(prev)
+                        nxt.prev = prev
                     if node is self.tail:
                         self.tail = prev
                     self.size -= 1
                 return True
             prev = node
-            node = node.Next()
+            node = node.next
         return False
 
+    # Deque-style API
+    append = insert_at_tail
+    appendleft = insert_at_head
+
+    def pop(self):
+        """Remove and return the last payload."""
+        if self.size == 0:
+            raise IndexError("pop from empty list")
+        value = self.tail.payload
+        self.delete_at_tail()
+        return value
+
+    def popleft(self):
+        """Remove and return the first payload."""
+        if self.size == 0:
+            raise IndexError("pop from empty list")
+        value = self.head.payload
+        self.delete_at_head()
+        return value
+
+    def _build_nodes(self, iterable) -> list:
+        """Create and doubly link nodes for `iterable` (in order); return them."""
+        NodeType = self.NodeType
+        nodes = [NodeType(item) for item in iterable]
+        for i in range(1, len(nodes)):
+            nodes[i - 1].next = nodes[i]
+            nodes[i].prev = nodes[i - 1]
+        return nodes
+
+    def extend(self, iterable):
+        """Append every item, linking the new chain onto the tail in one splice."""
+        nodes = self._build_nodes(iterable)
+        if not nodes:
+            return
+        if self.tail is not None:
+            self.tail.next = nodes[0]
+            nodes[0].prev = self.tail
+        else:
+            self.head = nodes[0]
+        self.tail = nodes[-1]
+        self.size += len(nodes)
+
+    def extendleft(self, iterable):
+        """Prepend every item one by one, like `deque.extendleft` (order ends up reversed)."""
+        nodes = self._build_nodes(reversed(list(iterable)))
+        if not nodes:
+            return
+        if self.head is not None:
+            nodes[-1].next = self.head
+            self.head.prev = nodes[-1]
+        else:
+            self.tail = nodes[-1]
+        self.head = nodes[0]
+        self.size += len(nodes)
+
+    # Bulk relinking: nodes move between lists, payloads are never copied
+    def _take_all(self, other):
+        """Detach every node of `other`; return (head, tail, size) and leave it empty."""
+        if not isinstance(other, DoublyLinkedList):
+            raise TypeError("Can only splice a DoublyLinkedList into a DoublyLinkedList")
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        chain = (other.head, other.tail, other.size)
+        other.head = None
+        other.tail = None
+        other.size = 0
+        return chain
+
+    def splice(self, other, at):
+        """Move all nodes of `other` in so its first element lands at 1-based `at`.
+
+        Only the boundary links change; locating position `at` walks from
+        the closer end. `other` is left empty.
+        """
+        if at < 1 or at > self.size + 1:
+            raise IndexError("Index out of bounds")
+        appending = at == self.size + 1
+        prev = None if at == 1 else (self.tail if appending else self.node_at(at - 1))
+        head, tail, count = self._take_all(other)
+        if count == 0:
+            return
+        nxt = self.head if prev is None else prev.next
+        if prev is None:
+            self.head = head
+        else:
+            prev.next = head
+        head.prev = prev
+        tail.next = nxt
+        if appending:
+            self.tail = tail
+        else:
+            nxt.prev = tail
+        self.size += count
+
+    def concat(self, other):
+        """Move all nodes of `other` onto the end of this list in O(1)."""
+        self.splice(other, self.size + 1)
+
+    def split_at(self, index):
+        """Keep the first `index` elements and return a new list holding the rest."""
+        if index < 0 or index > self.size:
+            raise IndexError("Index out of bounds")
+        rest = type(self)(node_type=self.NodeType)
+        if index == self.size:
+            return rest
+        if index == 0:
+            rest.head = self.head
+            self.head = None
+            new_tail = None
+        else:
+            new_tail = self.node_at(index)
+            rest.head = new_tail.next
+            new_tail.next = None
+            rest.head.prev = None
+        rest.tail = self.tail
+        rest.size = self.size - index
+        self.tail = new_tail
+        self.size = index
+        return rest
+
+    def slice(self, start, stop):
+        """Zero-copy view of 1-based positions `start` .. `stop - 1` (half-open, like `range`)."""
+        if start < 1 or stop < start or stop > self.size + 1:
+            raise IndexError("Index out of bounds")
+        return LinkedListSlice(self.node_at(start) if stop > start else None, stop - start)
+
+    def reverse(self):
+        """Reverse the list in place by swapping each node's links."""
+        node = self.head
+        for _ in range(self.size):
+            node.next, node.prev = node.prev, node.next
+            node = node.prev
+        self.head, self.tail = self.tail, self.head
+
     @classmethod
-    def from_head(cls, head_node):
+    def from_head(cls, head_node, loop_detection="brent"):
         """Construct a DoublyLinkedList view from an existing head node.
 
-        - Traverses using `Next()`; sets `Previous()` pointers to match
+        - Traverses using `.next`; sets `.prev` pointers to match
           traversal order (overwriting previous values if present).
         - Handles cycles: counts each unique node once and sets `tail`
           to the last unique node before the cycle repeats.
+          `loop_detection` picks the detector (see `detectLoop`); the
+          default uses O(1) extra memory.
         """
-        inst = cls()
+        inst = cls(node_type=type(head_node) if head_node is not None else None)
         inst.head = head_node
-        if head_node is None:
-            inst.tail = None
-            inst.size = 0
-            return inst
-
-        seen = {}
+        inst.size, _loopIndex = detectLoop(head_node, loop_detection)
         node = head_node
         prev = None
-        idx = 0
-        while node is not None:
-            nid = id(node)
-            if nid in seen:
-                inst.tail = prev
-                inst.size = len(seen)
-                return inst
+        for _ in range(inst.size):
             # link previous pointer to maintain doubly-linked invariant
-            if prev is None:
-                node.Previous(None)
-            else:
-                node.Previous(prev)
-
-            seen[nid] = node
+            node.prev = prev
             prev = node
-            node = node.Next()
-            idx += 1
-
+            node = node.next
         inst.tail = prev
-        inst.size = len(seen)
         return inst
+
+
+_NIL = -1
+
+
+class ArrayLinkedList:
+    """Singly-linked list stored in parallel slabs instead of node objects.
+
+    - `payloads[i]` is the value held in slot `i` and `nexts[i]` the slot of
+      its successor (`-1` for none); `head`/`tail` are slot numbers.
+    - Deleted slots are chained through `nexts` into a free list and reused
+      by later inserts, so churn does not grow the slabs.
+    - API mirrors `LinkedList`: `insert_at_head`, `insert_at_tail`,
+      `insert_at`, `delete_at_head`, `delete_at_tail`, `delete_at`,
+      `delete_value`, iteration, `__str__` and `from_head`.
+    """
+
+    def __init__(self, iterable=None):
+        self.payloads = []
+        self.nexts = array("q")
+        self.head = _NIL
+        self.tail = _NIL
+        self.size = 0
+        self._free = _NIL
+        if iterable:
+            self._bulk_load(iterable)
+
+    def _bulk_load(self, iterable):
+        """Fill an empty list in one pass: slot i links to slot i + 1."""
+        self.payloads = list(iterable)
+        count = len(self.payloads)
+        if count == 0:
+            return
+        self.nexts = array("q", range(1, count + 1))
+        self.nexts[-1] = _NIL
+        self.head = 0
+        self.tail = count - 1
+        self.size = count
+
+    def _allocate(self, value) -> int:
+        slot = self._free
+        if slot != _NIL:
+            self._free = self.nexts[slot]
+            self.payloads[slot] = value
+            self.nexts[slot] = _NIL
+            return slot
+        self.payloads.append(value)
+        self.nexts.append(_NIL)
+        return len(self.payloads) - 1
+
+    def _release(self, slot):
+        self.payloads[slot] = None  # drop the reference so the payload can be collected
+        self.nexts[slot] = self._free
+        self._free = slot
+
+    def _slot_at(self, index) -> int:
+        """Slot holding the 1-based `index`-th element (index must be valid)."""
+        nexts = self.nexts
+        slot = self.head
+        for _ in range(1, index):
+            slot = nexts[slot]
+        return slot
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        payloads = self.payloads
+        nexts = self.nexts
+        slot = self.head
+        while slot != _NIL:
+            yield payloads[slot]
+            slot = nexts[slot]
+
+    def __str__(self):
+        if self.size == 0:
+            return "None"
+        return " -> ".join(str(item) for item in self) + " -> None"
+
+    # Insertions
+    def insert_at_head(self, value):
+        slot = self._allocate(value)
+        self.nexts[slot] = self.head
+        self.head = slot
+        if self.tail == _NIL:
+            self.tail = slot
+        self.size += 1
+
+    def insert_at_tail(self, value):
+        slot = self._allocate(value)
+        if self.tail != _NIL:
+            self.nexts[self.tail] = slot
+        else:
+            self.head = slot
+        self.tail = slot
+        self.size += 1
+
+    def insert_at(self, index, value):
+        """Insert value at 1-based index. index==1 inserts at head; index==size+1 appends."""
+        if index < 1 or index > self.size + 1:
+            raise IndexError("Index out of bounds")
+        if index == 1:
+            return self.insert_at_head(value)
+        if index == self.size + 1:
+            return self.insert_at_tail(value)
+
+        prev = self._slot_at(index - 1)
+        slot = self._allocate(value)
+        self.nexts[slot] = self.nexts[prev]
+        self.nexts[prev] = slot
+        self.size += 1
+
+    # Deletions
+    def delete_at_head(self):
+        if self.size == 0:
+            raise IndexError("Delete from empty list")
+        slot = self.head
+        self.head = self.nexts[slot]
+        if self.head == _NIL:
+            self.tail = _NIL
+        self._release(slot)
+        self.size -= 1
+
+    def delete_at_tail(self):
+        if self.size == 0:
+            raise IndexError("Delete from empty list")
+        if self.size == 1:
+            return self.delete_at_head()
+        prev = self._slot_at(self.size - 1)
+        self._release(self.tail)
+        self.nexts[prev] = _NIL
+        self.tail = prev
+        self.size -= 1
+
+    def delete_at(self, index):
+        if index < 1 or index > self.size:
+            raise IndexError("Index out of bounds")
+        if index == 1:
+            return self.delete_at_head()
+        prev = self._slot_at(index - 1)
+        self._unlink_after(prev)
+
+    def _unlink_after(self, prev):
+        slot = self.nexts[prev]
+        self.nexts[prev] = self.nexts[slot]
+        if slot == self.tail:
+            self.tail = prev
+        self._release(slot)
+        self.size -= 1
+
+    def delete_value(self, value):
+        """Delete the first element that equals value. Returns True if deleted."""
+        payloads = self.payloads
+        nexts = self.nexts
+        prev = _NIL
+        slot = self.head
+        while slot != _NIL:
+            if payloads[slot] == value:
+                if prev == _NIL:
+                    self.delete_at_head()
+                else:
+                    self._unlink_after(prev)
+                return True
+            prev = slot
+            slot = nexts[slot]
+        return False
+
+    @classmethod
+    def from_head(cls, head_node, loop_detection="brent"):
+        """Copy the payloads of a node chain into a new slab-backed list.
+
+        Follows `.next` from `head_node`; if the chain loops, each unique
+        node is copied once (same rule as `LinkedList.from_head`).
+        """
+        view = LinkedList.from_head(head_node, loop_detection=loop_detection)
+        return cls(islice(view, len(view)))
+
+
+class ArrayDoublyLinkedList(ArrayLinkedList):
+    """Slab-backed doubly-linked list: `ArrayLinkedList` plus a `prevs` slab.
+
+    The back-links make `delete_at_tail` O(1) and let positional access
+    walk from whichever end is closer.
+    """
+
+    def __init__(self, iterable=None):
+        self.prevs = array("q")
+        super().__init__(iterable)
+
+    def _bulk_load(self, iterable):
+        super()._bulk_load(iterable)
+        if self.size:
+            self.prevs = array("q", range(-1, self.size - 1))
+
+    def _allocate(self, value) -> int:
+        slot = super()._allocate(value)
+        if slot == len(self.prevs):
+            self.prevs.append(_NIL)
+        else:
+            self.prevs[slot] = _NIL
+        return slot
+
+    def _slot_at(self, index) -> int:
+        if index <= (self.size + 1) // 2:
+            return super()._slot_at(index)
+        prevs = self.prevs
+        slot = self.tail
+        for _ in range(index, self.size):
+            slot = prevs[slot]
+        return slot
+
+    # Insertions
+    def insert_at_head(self, value):
+        old_head = self.head
+        super().insert_at_head(value)
+        if old_head != _NIL:
+            self.prevs[old_head] = self.head
+
+    def insert_at_tail(self, value):
+        old_tail = self.tail
+        super().insert_at_tail(value)
+        self.prevs[self.tail] = old_tail
+
+    def insert_at(self, index, value):
+        if index < 1 or index > self.size + 1:
+            raise IndexError("Index out of bounds")
+        if index == 1:
+            return self.insert_at_head(value)
+        if index == self.size + 1:
+            return self.insert_at_tail(value)
+
+        prev = self._slot_at(index - 1)
+        nxt = self.nexts[prev]
+        slot = self._allocate(value)
+        self.nexts[slot] = nxt
+        self.prevs[slot] = prev
+        self.nexts[prev] = slot
+        self.prevs[nxt] = slot
+        self.size += 1
+
+    # Deletions
+    def delete_at_head(self):
+        super().delete_at_head()
+        if self.head != _NIL:
+            self.prevs[self.head] = _NIL
+
+    def delete_at_tail(self):
+        if self.size == 0:
+            raise IndexError("Delete from empty list")
+        if self.size == 1:
+            return self.delete_at_head()
+        slot = self.tail
+        self.tail = self.prevs[slot]
+        self.nexts[self.tail] = _NIL
+        self._release(slot)
+        self.size -= 1
+
+    def _unlink_after(self, prev):
+        slot = self.nexts[prev]
+        nxt = self.nexts[slot]
+        if nxt != _NIL:
+            self.prevs[nxt] = prev
+        super()._unlink_after(prev)
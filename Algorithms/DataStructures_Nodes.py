@@ -1,7 +1,95 @@
-import copy
 import operator
 
-class Node:
+def _equalityOnly(op, coerce=None):
+    """Rule for str/bool payloads: ==/!= after optional coercion, no ordering."""
+    if op is not operator.eq and op is not operator.ne:
+        def reject(thisVal, thatVal):
+            raise TypeError(f"Unsupported ordering comparison for type {type(thisVal)}")
+        return reject
+    if coerce is None:
+        return op
+    return lambda thisVal, thatVal: op(thisVal, coerce(thatVal))
+
+def _compileRule(op, thisType: type, thatType: type):
+    """Pick the comparison rule for one (operator, payload type pair).
+
+    Mirrors the historical coercions: a str payload compares against
+    `str(other)`, a bool payload against the truthiness of `other`, and
+    both only support ==/!=. Every other pair uses the operator directly.
+    """
+    if thisType is not thatType:
+        if issubclass(thisType, str):
+            return _equalityOnly(op, str)
+        if issubclass(thisType, bool):
+            if issubclass(thatType, str):
+                return _equalityOnly(op, lambda thatVal: thatVal != "")
+            return _equalityOnly(op, lambda thatVal: thatVal != 0)
+    if issubclass(thisType, (str, bool)):
+        return _equalityOnly(op)
+    return op
+
+# operator -> {this payload type -> {that payload type -> rule}}
+_compareRules = {op: {} for op in (operator.lt, operator.gt, operator.le, operator.ge, operator.eq, operator.ne)}
+
+class _ComparableNode:
+    """Payload comparison and printing shared by every node flavour.
+
+    Declares no slots of its own so both the dict-backed `Node` family and
+    the `__slots__`-based `Slotted*` family can inherit from it.
+
+    Comparisons never copy the payloads: the coercion rule for a payload
+    type pair is compiled once by `_compileRule` and cached per operator.
+    """
+
+    __slots__ = ()
+
+    # Key function for `sorted`, `min`, `max`, `heapq.nsmallest`, ...:
+    # orders nodes by raw payload at C speed. Matches the comparison
+    # operators for homogeneous numeric payloads; unlike them it also
+    # orders str payloads naturally instead of raising.
+    sortKey = staticmethod(operator.attrgetter("payload"))
+
+    def heapEntry(self, tieBreaker: int = 0) -> tuple:
+        """Return `(payload, tieBreaker, node)` for use with `heapq`.
+
+        The tie breaker keeps `heapq` from ever comparing two nodes when
+        payloads are equal; pass a running counter for FIFO ordering.
+        """
+        return (self.payload, tieBreaker, self)
+
+    def __lt__(self, other: any) -> bool:
+        return self.__doCompare(operator.lt, other)
+
+    def __gt__(self, other: any) -> bool:
+        return self.__doCompare(operator.gt, other)
+
+    def __le__(self, other: any) -> bool:
+        return self.__doCompare(operator.le, other)
+
+    def __ge__(self, other: any) -> bool:
+        return self.__doCompare(operator.ge, other)
+
+    def __eq__(self, other: any) -> bool:
+        return self.__doCompare(operator.eq, other)
+
+    def __ne__(self, other: any) -> bool:
+        return self.__doCompare(operator.ne, other)
+
+    def __str__(self):
+        return str(self.payload)
+
+    def __doCompare(self, op, value: any) -> bool:
+        thisVal = self.payload
+        thatVal = value.payload if isinstance(value, _ComparableNode) else value
+        rulesByType = _compareRules[op]
+        try:
+            rule = rulesByType[type(thisVal)][type(thatVal)]
+        except KeyError:
+            rule = _compileRule(op, type(thisVal), type(thatVal))
+            rulesByType.setdefault(type(thisVal), {})[type(thatVal)] = rule
+        return rule(thisVal, thatVal)
+
+class Node(_ComparableNode):
     """Generic node base class.
 
     - Each instance has its own `payload` and `NodeLinks` dictionary.
@@ -45,115 +133,191 @@ class Node:
         # Getter case
         return self.NodeLinks.get(linkName, None)
 
-    def __lt__(self, other: any) -> bool:
-        return self.__doCompare(operator.lt, other)
+def detectLoop(head, method: str = "brent") -> tuple[int, int]:
+    """Measure the chain reachable from `head` through `.next`.
 
-    def __gt__(self, other: any) -> bool:
-        return self.__doCompare(operator.gt, other)
+    Returns `(count, loopIndex)`: the number of distinct nodes and the
+    0-based index of the node the tail links back to (-1 if the chain ends
+    in `None`). `method` selects the detector:
 
-    def __le__(self, other: any) -> bool:
-        return self.__doCompare(operator.le, other)
-
-    def __ge__(self, other: any) -> bool:
-        return self.__doCompare(operator.ge, other)
+    - "brent" (default) and "floyd": O(1) extra memory; Brent's variant
+      needs fewer `.next` steps.
+    - "visited": records every node's `id()`; O(n) extra memory, but a
+      single pass.
+    """
+    if head is None:
+        return 0, -1
+    if method == "brent":
+        return _brentLoop(head)
+    if method == "floyd":
+        return _floydLoop(head)
+    if method == "visited":
+        return _visitedLoop(head)
+    raise ValueError(f"Unknown loop detection method: {method!r}")
+
+def _loopEntry(head, loopLength: int) -> int:
+    """Index of the loop entry, given the loop length (both walkers start at head)."""
+    lead = head
+    for _ in range(loopLength):
+        lead = lead.next
+    trail = head
+    entry = 0
+    while trail is not lead:
+        trail = trail.next
+        lead = lead.next
+        entry += 1
+    return entry
+
+def _brentLoop(head) -> tuple[int, int]:
+    # The tortoise teleports to the hare at every power of two; the hare
+    # meets it within one block once both are inside the loop.
+    tortoise = hare = head
+    blockStart = 0  # index of the tortoise
+    power = 1
+    while True:
+        for loopLength in range(1, power + 1):
+            hare = hare.next
+            if hare is None:
+                return blockStart + loopLength, -1
+            if hare is tortoise:
+                entry = _loopEntry(head, loopLength)
+                return entry + loopLength, entry
+        tortoise = hare
+        blockStart += power
+        power *= 2
+
+def _floydLoop(head) -> tuple[int, int]:
+    slow = fast = head
+    steps = 0
+    while True:
+        if fast.next is None:
+            return 2 * steps + 1, -1
+        if fast.next.next is None:
+            return 2 * steps + 2, -1
+        slow = slow.next
+        fast = fast.next.next
+        steps += 1
+        if slow is fast:
+            break
+    loopLength = 1
+    walker = slow.next
+    while walker is not slow:
+        walker = walker.next
+        loopLength += 1
+    entry = _loopEntry(head, loopLength)
+    return entry + loopLength, entry
+
+def _visitedLoop(head) -> tuple[int, int]:
+    seen = {}
+    node = head
+    while node is not None:
+        nodeId = id(node)
+        if nodeId in seen:
+            return len(seen), seen[nodeId]
+        seen[nodeId] = len(seen)
+        node = node.next
+    return len(seen), -1
+
+def _linkProperty(linkName: str) -> property:
+    """Unvalidated attribute view of a `NodeLinks` entry.
+
+    Gives the dict-backed nodes the same `next`/`prev`/`left`/... attribute
+    protocol as the slotted nodes, so containers can use plain attribute
+    access regardless of which family they were built with.
+    """
+    def getter(self):
+        return self.NodeLinks.get(linkName)
 
-    def __eq__(self, other: any) -> bool:
-        return self.__doCompare(operator.eq, other)
+    def setter(self, node):
+        self.NodeLinks[linkName] = node
 
-    def __ne__(self, other: any) -> bool:
-        return self.__doCompare(operator.ne, other)
+    return property(getter, setter, doc=f"Direct access to the '{linkName}' link.")
 
-    def __str__(self):
-        return str(self.payload)
+class _SingleLinkChain:
+    """Chain algorithms for singly linked nodes; relies only on `.next`."""
 
-    def __doCompare(self, op, value: any) -> bool:
-        thisVal = copy.deepcopy(self.payload)
-        thatVal = copy.deepcopy(value.payload) if isinstance(value, Node) else copy.deepcopy(value)
-
-        # Allow some safe coercions similar to previous implementation
-        if type(thisVal) != type(thatVal):
-            if isinstance(thisVal, str):
-                thatVal = str(thatVal)
-            elif isinstance(thisVal, bool):
-                if isinstance(thatVal, str):
-                    thatVal = thatVal != ""
-                else:
-                    thatVal = thatVal != 0
-
-        # Disallow ordering comparisons for strings and bools (only ==/!= allowed)
-        if (isinstance(thisVal, str) or isinstance(thisVal, bool)) and op not in (operator.eq, operator.ne):
-            raise TypeError(f"Unsupported ordering comparison for type {type(thisVal)}")
+    __slots__ = ()
 
-        return op(thisVal, thatVal)
-
-class SingleLinkedListNode(Node):
-    def __init__(self, item=None, next: "SingleLinkedListNode" = None):
-        super().__init__(item)
-        self.NodeLinks["next"] = next
-
-    def Next(self, targetNode=Node._MISSING):
-        return self.GetSetLink("next", targetNode)
-    
     def Revert(self) -> "SingleLinkedListNode":
         """Reverts the linked list starting from this node and returns new head."""
         prev = None
         current = self
         while current is not None:
-            next_node = current.Next()
-            current.Next(prev)
+            next_node = current.next
+            current.next = prev
             prev = current
             current = next_node
         return prev
-    
-    def strChain(self) -> str:
+
+    def strChain(self, loopDetection: str = "brent", maxItems: int | None = None) -> str:
         """Creates a printable string for the linked list starting from this node.
-        Detects loops and indicates their position."""
-        theNodesInfo = self.__TraversalSearch()
-        if theNodesInfo["loopIndex"] != -1:
-            stringChain = " -> ".join(theNodesInfo["parts"])
-            if stringChain:
-                return f"{stringChain} -> (loop to index {theNodesInfo['loopIndex']}: {theNodesInfo['parts'][theNodesInfo['loopIndex']]})"
-            return f"(loop to index {theNodesInfo['loopIndex']}: {theNodesInfo['parts'][theNodesInfo['loopIndex']]})"
-        return " -> ".join(theNodesInfo["parts"]) + " -> None"
-    
-    def findNodeByIndex(self, index: int):
+        Detects loops and indicates their position.
+
+        `loopDetection` picks the detector, see `detectLoop`; `maxItems`
+        elides the middle of long chains, see `iterChain`.
+        """
+        return "".join(self.iterChain(maxItems, loopDetection))
+
+    def iterChain(self, maxItems: int | None = None, loopDetection: str = "brent"):
+        """Yield the `strChain` text in small chunks, never holding all of it.
+
+        With `maxItems`, chains longer than that render only their first
+        `ceil(maxItems / 2)` and last `floor(maxItems / 2)` payloads around
+        a `... (k more)` marker, so the cost in memory is O(output size).
+        Time stays O(n): the chain is walked to measure it and to reach
+        the tail items.
+        """
+        count, loopIndex = detectLoop(self, loopDetection)
+        if maxItems is None or count <= maxItems:
+            headItems = tailStart = count
+        else:
+            headItems = (maxItems + 1) // 2
+            tailStart = count - maxItems // 2
+        loopEntry = None
+        node = self
+        for idx in range(count):
+            if idx == loopIndex:
+                loopEntry = node
+            if idx < headItems or idx >= tailStart:
+                yield (" -> " if idx else "") + str(node.payload)
+            elif idx == headItems:
+                yield (" -> " if idx else "") + f"... ({tailStart - headItems} more)"
+            node = node.next
+        if loopEntry is not None:
+            yield f" -> (loop to index {loopIndex}: {loopEntry.payload})"
+        else:
+            yield " -> None"
+
+    def writeChain(self, stream, maxItems: int | None = None, loopDetection: str = "brent"):
+        """Write the `strChain` text to a file-like `stream` chunk by chunk."""
+        for chunk in self.iterChain(maxItems, loopDetection):
+            stream.write(chunk)
+
+    def findNodeByIndex(self, index: int, loopDetection: str = "brent"):
         """Finds a node by its 1-based index (positive) or negative index (from end).
-        Returns None if not found."""
+        Returns None if not found.
+
+        Positive indexes simply follow `.next`, so on a looped chain they
+        keep going around the loop. Negative indexes count back from the
+        last distinct node, found with `detectLoop`.
+        """
         if index == 0:
             return self
         if index > 0:
-            return self.__TraversalSearch(target=index, searchType="byIndex")["target"]
-        wholeListInfo = self.__TraversalSearch()
-        if wholeListInfo["count"] + index >= 0:
-            return wholeListInfo["parts"][index]
-        return None
-    
-    def __TraversalSearch(self, target: any = Node._MISSING, searchType: str = "byIndex") -> dict[str]:
-        traverser = self
-        retVal = {
-            "parts": [],
-            "target": Node._MISSING,
-            "loopIndex": -1,
-            "count": 0
-        }
-        seen = {}
-        idx = 0
-        while traverser is not None:
-            node_id = id(traverser)
-            if node_id in seen:
-                retVal["loopIndex"] = seen[node_id]
-                break
-
-            seen[node_id] = idx
-            retVal["parts"].append(str(traverser.payload))
-            traverser = traverser.Next()
-            idx += 1
-            if target != Node._MISSING and ((searchType == "byIndex" and idx == target-1) or (searchType == "byValue" and traverser.payload == target)):
-                retVal["target"] = traverser
-                break
-        retVal["count"] = idx
-        return retVal
-        
+            node = self
+            for _ in range(index - 1):
+                node = node.next
+                if node is None:
+                    return None
+            return node
+        count, _loopIndex = detectLoop(self, loopDetection)
+        if count + index < 0:
+            return None
+        node = self
+        for _ in range(count + index):
+            node = node.next
+        return node
+
     @classmethod
     def fromIterable(cls, iterable) -> "SingleLinkedListNode":
         """Creates a linked list from an iterable and returns the head node."""
@@ -166,31 +330,28 @@ class SingleLinkedListNode(Node):
         current = head
         for item in iterator:
             new_node = cls(item)
-            current.Next(new_node)
+            current.next = new_node
             current = new_node
 
         return head
 
-class DoublyLinkedListNode(SingleLinkedListNode):
-    def __init__(self, item=None, prev=None, next=None):
-        super().__init__(item, next)
-        self.NodeLinks["previous"] = prev
+class _DoubleLinkChain(_SingleLinkChain):
+    """Chain algorithms that also maintain the `.prev` back-links."""
+
+    __slots__ = ()
 
-    def Previous(self, targetNode=Node._MISSING):
-        return self.GetSetLink("previous", targetNode)
-    
     def Revert(self) -> "DoublyLinkedListNode":
         """Reverts the doubly linked list starting from this node and returns new head."""
         prev = None
         current = self
         while current is not None:
-            next_node = current.Next()
-            current.Next(prev)
-            current.Previous(next_node)
+            next_node = current.next
+            current.next = prev
+            current.prev = next_node
             prev = current
             current = next_node
         return prev
-    
+
     @classmethod
     def fromIterable(cls, iterable) -> "DoublyLinkedListNode":
         """Creates a doubly linked list from an iterable and returns the head node."""
@@ -203,33 +364,25 @@ class DoublyLinkedListNode(SingleLinkedListNode):
         current = head
         for item in iterator:
             new_node = cls(item)
-            current.Next(new_node)
-            new_node.Previous(current)
+            current.next = new_node
+            new_node.prev = current
             current = new_node
 
         return head
 
-class TreeNode(Node):
-    def __init__(self, item=None, leftNode=None, rightNode=None, parent=None):
-        super().__init__(item)
-        self.NodeLinks["left"] = leftNode
-        self.NodeLinks["right"] = rightNode
-        self.NodeLinks["parent"] = parent
-
-    def Left(self, targetNode=Node._MISSING):
-        return self.GetSetLink("left", targetNode)
+class _TreeOps:
+    """Tree helpers shared by `TreeNode` and `SlottedTreeNode`; relies only on `.left`/`.right`."""
 
-    def Right(self, targetNode=Node._MISSING):
-        return self.GetSetLink("right", targetNode)
+    __slots__ = ()
 
-    def Parent(self, targetNode=Node._MISSING):
-        return self.GetSetLink("parent", targetNode)
-    
     def getHeight(self) -> int:
-        left_height = self.Left().getHeight() if self.Left() else 0
-        right_height = self.Right().getHeight() if self.Right() else 0
-        return 1 + max(left_height, right_height)
-    
+        """Cached subtree height (leaf == 1), O(1).
+
+        Kept current by BinaryTree/AVLTree; call `BinaryTree.from_root` to
+        refresh it after linking nodes by hand.
+        """
+        return self.height
+
     def printTree(self):
         height = self.getHeight()
         currentNodes = [{"node":self, "level":0}]
@@ -242,9 +395,115 @@ class TreeNode(Node):
                 prev_level = nodeInfo["level"]
                 padding = " " * (2**(height - prev_level))
             print(padding + str(nodeInfo["node"]), end=padding)
-            if nodeInfo["node"].Left():
-                currentNodes.append({"node": nodeInfo["node"].Left(), "level": nodeInfo["level"] + 1})
-            if nodeInfo["node"].Right():
-                currentNodes.append({"node": nodeInfo["node"].Right(), "level": nodeInfo["level"] + 1})
+            if nodeInfo["node"].left:
+                currentNodes.append({"node": nodeInfo["node"].left, "level": nodeInfo["level"] + 1})
+            if nodeInfo["node"].right:
+                currentNodes.append({"node": nodeInfo["node"].right, "level": nodeInfo["level"] + 1})
         print()
 
+class SingleLinkedListNode(_SingleLinkChain, Node):
+    next = _linkProperty("next")
+
+    def __init__(self, item=None, next: "SingleLinkedListNode" = None):
+        super().__init__(item)
+        self.NodeLinks["next"] = next
+
+    def Next(self, targetNode=Node._MISSING):
+        return self.GetSetLink("next", targetNode)
+
+class DoublyLinkedListNode(_DoubleLinkChain, SingleLinkedListNode):
+    prev = _linkProperty("previous")
+
+    def __init__(self, item=None, prev=None, next=None):
+        super().__init__(item, next)
+        self.NodeLinks["previous"] = prev
+
+    def Previous(self, targetNode=Node._MISSING):
+        return self.GetSetLink("previous", targetNode)
+
+class TreeNode(_TreeOps, Node):
+    left = _linkProperty("left")
+    right = _linkProperty("right")
+    parent = _linkProperty("parent")
+
+    def __init__(self, item=None, leftNode=None, rightNode=None, parent=None):
+        super().__init__(item)
+        self.NodeLinks["left"] = leftNode
+        self.NodeLinks["right"] = rightNode
+        self.NodeLinks["parent"] = parent
+        # Cached subtree height (leaf == 1) and node count, maintained by BinaryTree.
+        self.height = 1
+        self.size = 1
+
+    def Left(self, targetNode=Node._MISSING):
+        return self.GetSetLink("left", targetNode)
+
+    def Right(self, targetNode=Node._MISSING):
+        return self.GetSetLink("right", targetNode)
+
+    def Parent(self, targetNode=Node._MISSING):
+        return self.GetSetLink("parent", targetNode)
+
+# Slotted fast-path family.
+#
+# Same methods as the classes above, but links are plain `__slots__`
+# attributes: no per-instance `__dict__`, no `NodeLinks` dict and no type
+# validation on the accessor methods. Use these for large or
+# traversal-heavy structures; the containers in DataStructures_LinkedLists
+# and DataStructures_Trees accept them through their `node_type` argument.
+
+class SlottedSingleLinkedListNode(_SingleLinkChain, _ComparableNode):
+    __slots__ = ("payload", "next")
+
+    def __init__(self, item=None, next: "SlottedSingleLinkedListNode" = None):
+        self.payload = item
+        self.next = next
+
+    def Next(self, targetNode=Node._MISSING):
+        if targetNode is Node._MISSING:
+            return self.next
+        self.next = targetNode
+        return targetNode
+
+class SlottedDoublyLinkedListNode(_DoubleLinkChain, SlottedSingleLinkedListNode):
+    __slots__ = ("prev",)
+
+    def __init__(self, item=None, prev=None, next=None):
+        self.payload = item
+        self.next = next
+        self.prev = prev
+
+    def Previous(self, targetNode=Node._MISSING):
+        if targetNode is Node._MISSING:
+            return self.prev
+        self.prev = targetNode
+        return targetNode
+
+class SlottedTreeNode(_TreeOps, _ComparableNode):
+    __slots__ = ("payload", "left", "right", "parent", "height", "size")
+
+    def __init__(self, item=None, leftNode=None, rightNode=None, parent=None):
+        self.payload = item
+        self.left = leftNode
+        self.right = rightNode
+        self.parent = parent
+        self.height = 1
+        self.size = 1
+
+    def Left(self, targetNode=Node._MISSING):
+        if targetNode is Node._MISSING:
+            return self.left
+        self.left = targetNode
+        return targetNode
+
+    def Right(self, targetNode=Node._MISSING):
+        if targetNode is Node._MISSING:
+            return self.right
+        self.right = targetNode
+        return targetNode
+
+    def Parent(self, targetNode=Node._MISSING):
+        if targetNode is Node._MISSING:
+            return self.parent
+        self.parent = targetNode
+        return targetNode
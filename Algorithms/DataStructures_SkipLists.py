@@ -0,0 +1,140 @@
+import random
+from typing import Iterable, Optional
+
+
+class _SkipNode:
+    __slots__ = ("value", "nexts", "widths")
+
+    def __init__(self, value, height: int):
+        self.value = value
+        # nexts[level] is the following node on that level; widths[level]
+        # is how many bottom-level steps that link skips over.
+        self.nexts: list[Optional["_SkipNode"]] = [None] * height
+        self.widths: list[int] = [1] * height
+
+
+class IndexableSkipList:
+    """Positional sequence with O(log n) expected get, insert and delete.
+
+    - Elements are addressed by 1-based position, like `LinkedList`.
+    - Each link stores its span (number of elements it skips), so a
+      position is found by summing spans top-down instead of walking.
+    - Element heights are geometric with p = 1/2, capped at `MAX_LEVELS`.
+    """
+
+    MAX_LEVELS = 32
+
+    def __init__(self, iterable: Optional[Iterable] = None, seed: Optional[int] = None):
+        self._random = random.Random(seed)
+        self.head = _SkipNode(None, self.MAX_LEVELS)
+        self.levels = 1  # levels currently in use
+        self.size = 0
+        if iterable is not None:
+            self._bulk_load(iterable)
+
+    def _random_height(self) -> int:
+        height = 1
+        bits = self._random.getrandbits(self.MAX_LEVELS - 1)
+        while bits & 1:
+            height += 1
+            bits >>= 1
+        return height
+
+    def _bulk_load(self, iterable):
+        """Link every element in one pass (O(n)); the list must be empty."""
+        last = [self.head] * self.MAX_LEVELS
+        last_pos = [0] * self.MAX_LEVELS
+        pos = 0
+        for value in iterable:
+            pos += 1
+            height = self._random_height()
+            node = _SkipNode(value, height)
+            for level in range(height):
+                last[level].nexts[level] = node
+                last[level].widths[level] = pos - last_pos[level]
+                last[level] = node
+                last_pos[level] = pos
+            if height > self.levels:
+                self.levels = height
+        self.size = pos
+
+    def _predecessors(self, index: int) -> tuple[list, list]:
+        """Per level, the last node before position `index` and its position."""
+        chain = [None] * self.levels
+        positions = [0] * self.levels
+        node = self.head
+        pos = 0
+        for level in range(self.levels - 1, -1, -1):
+            nxt = node.nexts[level]
+            while nxt is not None and pos + node.widths[level] < index:
+                pos += node.widths[level]
+                node = nxt
+                nxt = node.nexts[level]
+            chain[level] = node
+            positions[level] = pos
+        return chain, positions
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        node = self.head.nexts[0]
+        while node is not None:
+            yield node.value
+            node = node.nexts[0]
+
+    def get(self, index: int):
+        """Return the element at 1-based `index`."""
+        if index < 1 or index > self.size:
+            raise IndexError("Index out of bounds")
+        node = self.head
+        pos = 0
+        for level in range(self.levels - 1, -1, -1):
+            while node.nexts[level] is not None and pos + node.widths[level] <= index:
+                pos += node.widths[level]
+                node = node.nexts[level]
+            if pos == index:
+                break
+        return node.value
+
+    def insert(self, index: int, value):
+        """Insert `value` so that it ends up at 1-based `index` (size + 1 appends)."""
+        if index < 1 or index > self.size + 1:
+            raise IndexError("Index out of bounds")
+        height = self._random_height()
+        if height > self.levels:
+            self.levels = height
+        chain, positions = self._predecessors(index)
+        node = _SkipNode(value, height)
+        for level in range(self.levels):
+            prev = chain[level]
+            if level < height:
+                node.nexts[level] = prev.nexts[level]
+                node.widths[level] = positions[level] + prev.widths[level] + 1 - index
+                prev.nexts[level] = node
+                prev.widths[level] = index - positions[level]
+            elif prev.nexts[level] is not None:
+                prev.widths[level] += 1
+        self.size += 1
+
+    def append(self, value):
+        self.insert(self.size + 1, value)
+
+    def delete(self, index: int):
+        """Remove and return the element at 1-based `index`."""
+        if index < 1 or index > self.size:
+            raise IndexError("Index out of bounds")
+        chain, _positions = self._predecessors(index)
+        node = chain[0].nexts[0]
+        height = len(node.nexts)
+        for level in range(self.levels):
+            prev = chain[level]
+            if level < height:
+                prev.nexts[level] = node.nexts[level]
+                prev.widths[level] += node.widths[level] - 1
+            elif prev.nexts[level] is not None:
+                prev.widths[level] -= 1
+        while self.levels > 1 and self.head.nexts[self.levels - 1] is None:
+            self.levels -= 1
+        self.size -= 1
+        return node.value
@@ -3,18 +3,83 @@ from typing import Generator, Optional
 from DataStructures_Nodes import TreeNode
 
 
+def _height(node) -> int:
+    return node.height if node is not None else 0
+
+
+def _size(node) -> int:
+    return node.size if node is not None else 0
+
+
+def _update_node(node):
+    """Recompute `node.height` and `node.size` from its children."""
+    left, right = node.left, node.right
+    left_height = left.height if left is not None else 0
+    right_height = right.height if right is not None else 0
+    node.height = 1 + (left_height if left_height > right_height else right_height)
+    node.size = 1 + (left.size if left is not None else 0) + (right.size if right is not None else 0)
+
+
+def _next_node(node):
+    """In-order successor of `node` via child and parent links, or None."""
+    if node.right is not None:
+        node = node.right
+        while node.left is not None:
+            node = node.left
+        return node
+    parent = node.parent
+    while parent is not None and node is parent.right:
+        node = parent
+        parent = parent.parent
+    return parent
+
+
+def _build_balanced(NodeType, values, lo, hi, parent):
+    """Link `values[lo..hi]` into a perfectly balanced subtree; return its root."""
+    if lo > hi:
+        return None
+    mid = (lo + hi) // 2
+    node = NodeType(values[mid])
+    node.parent = parent
+    node.left = _build_balanced(NodeType, values, lo, mid - 1, node)
+    node.right = _build_balanced(NodeType, values, mid + 1, hi, node)
+    _update_node(node)
+    return node
+
+
 class BinaryTree:
     """Simple binary search tree (BST) wrapper around `TreeNode`.
 
     - Not balanced. Uses Python value ordering for comparisons.
-    - Methods: insert, find, inorder/preorder/postorder generators, to_list.
+    - Methods: insert, delete, find, inorder/preorder/postorder generators,
+      to_list, and order statistics rank/select/count_range.
+    - Every node caches its subtree `height` and `size`, kept current by
+      `insert` and `delete` in O(h); this makes `getHeight` O(1) and the order
+      statistics O(h).
     - `from_root` classmethod builds a BinaryTree view from an existing
       `TreeNode` root and computes `.size` while protecting against cycles.
+    - `from_sorted` / `from_iterable` bulk-load a balanced tree instead of
+      inserting one value at a time.
+    - `range(lo, hi)` lazily yields the stored values in `[lo, hi]`, and
+      `floor` / `ceiling` / `successor` / `predecessor` answer nearest-value
+      queries, all by pruning with the BST property.
+    - `node_type` selects the node class, e.g. `SlottedTreeNode` for the
+      `__slots__` fast path.
+    - `pool_size` keeps up to that many deleted nodes for reuse by later
+      inserts, so insert/delete churn stops allocating. `delete` only ever
+      releases the node that held the deleted value, so a node returned by
+      `insert` is recycled only after its own value has been deleted.
     """
 
-    def __init__(self, iterable=None):
+    NodeType = TreeNode
+
+    def __init__(self, iterable=None, node_type=None, pool_size=0):
+        if node_type is not None:
+            self.NodeType = node_type
         self.root: Optional[TreeNode] = None
         self.size = 0
+        self.pool_size = pool_size
+        self._pool = []
         if iterable:
             for v in iterable:
                 self.insert(v)
@@ -24,32 +89,109 @@ class BinaryTree:
 
         If the tree is empty, sets root. Otherwise inserts as a leaf.
         """
-        new_node = TreeNode(value)
-        if self.root is None:
+        # Find the parent first: if a comparison raises, nothing has changed.
+        parent = None
+        go_left = False
+        curr = self.root
+        while curr is not None:
+            parent = curr
+            # Use payload comparison; allow TreeNode wrappers in comparison.
+            go_left = value < curr.payload
+            curr = curr.left if go_left else curr.right
+
+        if self._pool:
+            new_node = self._pool.pop()
+            new_node.payload = value
+        else:
+            new_node = self.NodeType(value)
+        self.size += 1
+        if parent is None:
             self.root = new_node
-            self.size = 1
             return new_node
+        if go_left:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        new_node.parent = parent
 
-        curr = self.root
-        while True:
-            # Use payload comparison; allow TreeNode wrappers in comparison.
-            curr_val = curr.payload
-            if value < curr_val:
-                left = curr.Left()
-                if left is None:
-                    curr.Left(new_node)
-                    new_node.Parent(curr)
-                    self.size += 1
-                    return new_node
-                curr = left
+        # Every ancestor gains a descendant; heights only change along the
+        # path until one stays the same.
+        child = new_node
+        growing = True
+        curr = parent
+        while curr is not None:
+            curr.size += 1
+            if growing:
+                if curr.height <= child.height:
+                    curr.height = child.height + 1
+                else:
+                    growing = False
+            child = curr
+            curr = curr.parent
+        return new_node
+
+    def delete(self, value) -> bool:
+        """Remove one node equal to `value`. Returns True if a node was removed.
+
+        Handles the leaf, one-child and two-child cases in O(h), keeping the
+        `.parent` links and cached heights/sizes correct.
+        """
+        node = self.find(value)
+        if node is None:
+            return False
+        if node.left is not None and node.right is not None:
+            # Two children: move the in-order successor node (it has no left
+            # child) into this node's place, so every remaining value keeps
+            # its node object.
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            if successor is node.right:
+                parent = successor
             else:
-                right = curr.Right()
-                if right is None:
-                    curr.Right(new_node)
-                    new_node.Parent(curr)
-                    self.size += 1
-                    return new_node
-                curr = right
+                parent = successor.parent
+                parent.left = successor.right
+                if successor.right is not None:
+                    successor.right.parent = parent
+                successor.right = node.right
+                node.right.parent = successor
+            successor.left = node.left
+            node.left.parent = successor
+            successor.parent = node.parent
+            self._replace_child(node.parent, node, successor)
+        else:
+            child = node.left if node.left is not None else node.right
+            parent = node.parent
+            if child is not None:
+                child.parent = parent
+            self._replace_child(parent, node, child)
+        self._release(node)
+        self.size -= 1
+        self._rebalance_upward(parent)
+        return True
+
+    def _replace_child(self, parent, old, new):
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _release(self, node):
+        """Detach a removed node and keep it for reuse if the pool has room."""
+        node.left = node.right = node.parent = None
+        if len(self._pool) < self.pool_size:
+            node.payload = None
+            node.height = 1
+            node.size = 1
+            self._pool.append(node)
+
+    def _rebalance_upward(self, node):
+        """Refresh cached heights/sizes from `node` up to the root."""
+        while node is not None:
+            _update_node(node)
+            node = node.parent
 
     def find(self, value) -> Optional[TreeNode]:
         """Find node by value using BST property; return the node or None."""
@@ -58,67 +200,73 @@ class BinaryTree:
             if value == curr.payload:
                 return curr
             if value < curr.payload:
-                curr = curr.Left()
+                curr = curr.left
             else:
-                curr = curr.Right()
+                curr = curr.right
         return None
 
-    def inorder(self, node: Optional[TreeNode] = None, _seen=None) -> Generator:
+    # Traversals use an explicit stack: O(n) total, O(h) memory and no
+    # recursion limit. `detect_cycles=True` skips nodes already visited
+    # (O(n) extra memory) for hand-linked structures that may not be trees.
+    def inorder(self, node: Optional[TreeNode] = None, detect_cycles: bool = False) -> Generator:
         if node is None:
             node = self.root
-        if node is None:
-            return
-        if _seen is None:
-            _seen = set()
-        nid = id(node)
-        if nid in _seen:
-            return
-        _seen.add(nid)
-        left = node.Left()
-        if left is not None:
-            yield from self.inorder(left, _seen)
-        yield node.payload
-        right = node.Right()
-        if right is not None:
-            yield from self.inorder(right, _seen)
-
-    def preorder(self, node: Optional[TreeNode] = None, _seen=None) -> Generator:
+        seen = set() if detect_cycles else None
+        stack = []
+        while stack or node is not None:
+            while node is not None:
+                if seen is not None:
+                    if id(node) in seen:
+                        break
+                    seen.add(id(node))
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            yield node.payload
+            node = node.right
+
+    def preorder(self, node: Optional[TreeNode] = None, detect_cycles: bool = False) -> Generator:
         if node is None:
             node = self.root
-        if node is None:
-            return
-        if _seen is None:
-            _seen = set()
-        nid = id(node)
-        if nid in _seen:
-            return
-        _seen.add(nid)
-        yield node.payload
-        left = node.Left()
-        if left is not None:
-            yield from self.preorder(left, _seen)
-        right = node.Right()
-        if right is not None:
-            yield from self.preorder(right, _seen)
-
-    def postorder(self, node: Optional[TreeNode] = None, _seen=None) -> Generator:
+        seen = set() if detect_cycles else None
+        stack = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
+            if seen is not None:
+                if id(node) in seen:
+                    continue
+                seen.add(id(node))
+            yield node.payload
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def postorder(self, node: Optional[TreeNode] = None, detect_cycles: bool = False) -> Generator:
         if node is None:
             node = self.root
-        if node is None:
-            return
-        if _seen is None:
-            _seen = set()
-        nid = id(node)
-        if nid in _seen:
-            return
-        _seen.add(nid)
-        left = node.Left()
-        if left is not None:
-            yield from self.postorder(left, _seen)
-        right = node.Right()
-        if right is not None:
-            yield from self.postorder(right, _seen)
-        yield node.payload
+        seen = set() if detect_cycles else None
+        stack = []
+        last = None  # last node emitted (or skipped as already seen)
+        while stack or node is not None:
+            if node is not None:
+                if seen is not None:
+                    if id(node) in seen:
+                        last = node
+                        node = None
+                        continue
+                    seen.add(id(node))
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right is not None and top.right is not last:
+                    node = top.right
+                else:
+                    yield top.payload
+                    last = stack.pop()
 
     def inorder_list(self):
         return list(self.inorder())
@@ -146,7 +294,7 @@ class BinaryTree:
         parent pointers for any children encountered.
         Protects against cycles by tracking visited node ids.
         """
-        inst = cls()
+        inst = cls(node_type=type(root_node) if root_node is not None else None)
         inst.root = root_node
         if root_node is None:
             inst.size = 0
@@ -154,29 +302,233 @@ class BinaryTree:
 
         q = deque([root_node])
         seen = set()
-        count = 0
+        order = []
         while q:
             node = q.popleft()
             nid = id(node)
             if nid in seen:
                 continue
             seen.add(nid)
-            count += 1
-            left = node.Left()
+            order.append(node)
+            left = node.left
             if left is not None:
-                left.Parent(node)
+                left.parent = node
                 q.append(left)
-            right = node.Right()
+            right = node.right
             if right is not None:
-                right.Parent(node)
+                right.parent = node
                 q.append(right)
 
-        inst.size = count
+        # Children come after their parent in BFS order, so walking it
+        # backwards refreshes the cached heights/sizes bottom-up.
+        for node in reversed(order):
+            _update_node(node)
+        inst.size = len(order)
+        return inst
+
+    @classmethod
+    def from_sorted(cls, seq, node_type=None):
+        """Bulk-load a perfectly balanced tree from ascending `seq` in O(n).
+
+        Makes no comparisons, so `seq` must already be sorted (equal values
+        allowed). The result is height-balanced, hence also a valid
+        `AVLTree` when called on that class.
+        """
+        values = seq if isinstance(seq, (list, tuple)) else list(seq)
+        inst = cls(node_type=node_type)
+        inst.root = _build_balanced(inst.NodeType, values, 0, len(values) - 1, None)
+        inst.size = len(values)
         return inst
 
+    @classmethod
+    def from_iterable(cls, seq, presort=True, node_type=None):
+        """Build a tree from unordered values.
+
+        With `presort` (default) the values are sorted once and bulk-loaded
+        by `from_sorted` in O(n log n) total; otherwise they are inserted one
+        by one as `BinaryTree(seq)` does.
+        """
+        if presort:
+            return cls.from_sorted(sorted(seq), node_type=node_type)
+        return cls(seq, node_type=node_type)
+
+    # Ordered queries: O(h) descent, then parent-link successor walks
+    def _lower_bound(self, value):
+        """Leftmost node whose payload is >= `value`, or None."""
+        found = None
+        node = self.root
+        while node is not None:
+            if node.payload < value:
+                node = node.right
+            else:
+                found = node
+                node = node.left
+        return found
+
+    def range(self, lo=None, hi=None) -> Generator:
+        """Yield stored values `v` with `lo <= v <= hi` in ascending order.
+
+        Costs O(h + k) for k results; values are produced lazily. A bound of
+        None leaves that side open. The tree must not be modified while the
+        generator is running.
+        """
+        if lo is None:
+            node = self.root
+            if node is not None:
+                while node.left is not None:
+                    node = node.left
+        else:
+            node = self._lower_bound(lo)
+        while node is not None:
+            value = node.payload
+            if hi is not None and hi < value:
+                return
+            yield value
+            node = _next_node(node)
+
+    def floor(self, value):
+        """Largest stored value `<= value`, or None."""
+        found = None
+        node = self.root
+        while node is not None:
+            if value < node.payload:
+                node = node.left
+            else:
+                found = node
+                node = node.right
+        return None if found is None else found.payload
+
+    def ceiling(self, value):
+        """Smallest stored value `>= value`, or None."""
+        found = self._lower_bound(value)
+        return None if found is None else found.payload
+
+    def successor(self, value):
+        """Smallest stored value strictly greater than `value`, or None."""
+        found = None
+        node = self.root
+        while node is not None:
+            if value < node.payload:
+                found = node
+                node = node.left
+            else:
+                node = node.right
+        return None if found is None else found.payload
+
+    def predecessor(self, value):
+        """Largest stored value strictly less than `value`, or None."""
+        found = None
+        node = self.root
+        while node is not None:
+            if node.payload < value:
+                found = node
+                node = node.right
+            else:
+                node = node.left
+        return None if found is None else found.payload
+
+    # Order statistics (O(h) using the cached subtree sizes)
+    def rank(self, value) -> int:
+        """Number of stored values strictly less than `value`."""
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.payload < value:
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def _count_at_most(self, value) -> int:
+        count = 0
+        node = self.root
+        while node is not None:
+            if value < node.payload:
+                node = node.left
+            else:
+                count += _size(node.left) + 1
+                node = node.right
+        return count
+
+    def select(self, k: int):
+        """Return the k-th smallest value (1-based, like the list classes)."""
+        if k < 1 or k > self.size:
+            raise IndexError("Index out of bounds")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if k <= left_size:
+                node = node.left
+            elif k == left_size + 1:
+                return node.payload
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def count_range(self, lo, hi) -> int:
+        """Number of stored values `v` with `lo <= v <= hi`."""
+        if hi < lo:
+            return 0
+        return self._count_at_most(hi) - self.rank(lo)
+
 class AVLTree(BinaryTree):
-    """Placeholder for future AVL tree implementation."""
-    pass
+    """Self-balancing BST: sibling subtree heights differ by at most one.
+
+    - Same API as `BinaryTree` (`insert`, `delete`, `find`, traversals,
+      `from_root`); lookups stay O(log n) for any insert order.
+    - Inserts and deletes refresh the cached `.height`/`.size` on the way
+      back up through `.parent`, rotating where the heights of two
+      siblings differ by more than one.
+    - Equal values are allowed; rotations may move a duplicate to either
+      side of its twin, so `find` returns one of them.
+    """
+
+    def insert(self, value):
+        new_node = super().insert(value)
+        self._rebalance_upward(new_node.parent)
+        return new_node
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+        pivot.parent = node.parent
+        self._replace_child(node.parent, node, pivot)
+        pivot.left = node
+        node.parent = pivot
+        _update_node(node)
+        _update_node(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+        pivot.parent = node.parent
+        self._replace_child(node.parent, node, pivot)
+        pivot.right = node
+        node.parent = pivot
+        _update_node(node)
+        _update_node(pivot)
+        return pivot
+
+    def _rebalance_upward(self, node):
+        """Refresh cached heights/sizes from `node` to the root, rotating unbalanced nodes."""
+        while node is not None:
+            _update_node(node)
+            balance = _height(node.left) - _height(node.right)
+            if balance > 1:
+                if _height(node.left.left) < _height(node.left.right):
+                    self._rotate_left(node.left)
+                node = self._rotate_right(node)
+            elif balance < -1:
+                if _height(node.right.right) < _height(node.right.left):
+                    self._rotate_right(node.right)
+                node = self._rotate_left(node)
+            node = node.parent
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+"""Small helpers shared by the benchmark scripts in this folder.
+
+Every script puts `Algorithms/` and `Challenges/` on `sys.path` the same way
+so they can be run from any working directory:
+
+    python Benchmarks/Benchmark_Nodes.py
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _folder in ("Algorithms", "Challenges"):
+    _path = os.path.join(_ROOT, _folder)
+    if _path not in sys.path:
+        sys.path.append(_path)
+
+
+def bestTime(func, repeat: int = 3) -> float:
+    """Best wall-clock time of `repeat` calls to `func()`, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bestTimeWithSetup(setup, func, repeat: int = 3) -> float:
+    """Like `bestTime`, but `func(setup())` only times `func`, not `setup`."""
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peakMemory(func) -> tuple[int, object]:
+    """Run `func()` under tracemalloc; return (bytes still allocated, result).
+
+    The result is kept alive while measuring so the figure reflects the
+    memory held by whatever `func` built.
+    """
+    tracemalloc.start()
+    try:
+        result = func()
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current, result
+
+
+def allocationPeak(func) -> tuple[int, object]:
+    """Run `func()` under tracemalloc; return (peak bytes allocated during the call, result)."""
+    tracemalloc.start()
+    try:
+        result = func()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, result
+
+
+def randomGraph(numNodes: int, edgesPerNode: int, maxWeight: int = 100, rng=random) -> dict:
+    """Random directed graph as `{node: [(neighbor, weight), ...]}`.
+
+    Nodes are `0..numNodes-1`; a ring edge `i -> i+1` keeps every node
+    reachable from 0.
+    """
+    graph = {}
+    for node in range(numNodes):
+        edges = [((node + 1) % numNodes, rng.randint(1, maxWeight))]
+        for _ in range(edgesPerNode - 1):
+            edges.append((rng.randrange(numNodes), rng.randint(1, maxWeight)))
+        graph[node] = edges
+    return graph
+
+
+def printTable(headers: list[str], rows: list[list]):
+    """Print `rows` as a plain left-aligned text table."""
+    cells = [[str(h) for h in headers]] + [[_fmt(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for lineNo, row in enumerate(cells):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)))
+        if lineNo == 0:
+            print("  ".join("-" * width for width in widths))
+    print()
+
+
+def _fmt(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.6f}"
+    return str(value)
@@ -0,0 +1,39 @@
+"""BinaryTree vs AVLTree on sorted, reverse-sorted and random insert orders."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedTreeNode
+from DataStructures_Trees import BinaryTree, AVLTree
+import random
+
+
+def treeHeight(tree):
+    """Cached height of the root, or 0 for an empty tree."""
+    return tree.root.height if tree.root is not None else 0
+
+
+def findAll(tree, keys):
+    for key in keys:
+        tree.find(key)
+
+
+if __name__ == "__main__":
+    random.seed(11)
+    for n in (1_000, 4_000):
+        orders = {
+            "sorted": list(range(n)),
+            "reverse": list(range(n, 0, -1)),
+            "random": random.sample(range(n), n),
+        }
+        rows = []
+        for orderName, keys in orders.items():
+            for treeCls in (BinaryTree, AVLTree):
+                build = lambda: treeCls(keys, node_type=SlottedTreeNode)
+                tree = build()
+                rows.append([
+                    orderName,
+                    treeCls.__name__,
+                    bt.bestTime(build, repeat=1),
+                    bt.bestTime(lambda: findAll(tree, keys), repeat=1),
+                    treeHeight(tree),
+                ])
+        print(f"n={n} inserts, then one find per key")
+        bt.printTable(["order", "tree", "insert all s", "find all s", "height"], rows)
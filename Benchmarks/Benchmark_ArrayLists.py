@@ -0,0 +1,39 @@
+"""Slab-backed lists vs node-object lists: memory, bulk build, traversal, churn."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedSingleLinkedListNode, SlottedDoublyLinkedListNode
+from DataStructures_LinkedLists import (
+    LinkedList, DoublyLinkedList, ArrayLinkedList, ArrayDoublyLinkedList,
+)
+
+N = 300_000
+
+VARIANTS = [
+    ("LinkedList", lambda items: LinkedList(items)),
+    ("LinkedList[slotted]", lambda items: LinkedList(items, node_type=SlottedSingleLinkedListNode)),
+    ("ArrayLinkedList", lambda items: ArrayLinkedList(items)),
+    ("DoublyLinkedList", lambda items: DoublyLinkedList(items)),
+    ("DoublyLinkedList[slotted]", lambda items: DoublyLinkedList(items, node_type=SlottedDoublyLinkedListNode)),
+    ("ArrayDoublyLinkedList", lambda items: ArrayDoublyLinkedList(items)),
+]
+
+
+def churn(lst, rounds):
+    for i in range(rounds):
+        lst.insert_at_tail(i)
+        lst.delete_at_head()
+
+
+if __name__ == "__main__":
+    items = list(range(N))
+    rows = []
+    for name, build in VARIANTS:
+        memory, lst = bt.peakMemory(lambda: build(items))
+        rows.append([
+            name,
+            memory // N,
+            bt.bestTime(lambda: build(items)),
+            bt.bestTime(lambda: sum(lst)),
+            bt.bestTime(lambda: churn(lst, N // 3), repeat=1),
+        ])
+    print(f"N={N} (payload ints are shared, so bytes/element is container overhead only)")
+    bt.printTable(["list", "bytes/element", "bulk build s", "traverse s", "churn s"], rows)
@@ -0,0 +1,24 @@
+"""Restoring a tree from a snapshot: per-value inserts vs balanced bulk load."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedTreeNode
+from DataStructures_Trees import BinaryTree, AVLTree
+import random
+
+
+if __name__ == "__main__":
+    random.seed(12)
+    for n in (10_000, 100_000):
+        shuffled = random.sample(range(n), n)
+        snapshot = sorted(shuffled)
+        rows = [
+            ["BinaryTree insert (random order)",
+             bt.bestTime(lambda: BinaryTree(shuffled, node_type=SlottedTreeNode), repeat=1)],
+            ["AVLTree insert (random order)",
+             bt.bestTime(lambda: AVLTree(shuffled, node_type=SlottedTreeNode), repeat=1)],
+            ["AVLTree.from_iterable (sort + load)",
+             bt.bestTime(lambda: AVLTree.from_iterable(shuffled, node_type=SlottedTreeNode))],
+            ["AVLTree.from_sorted (snapshot)",
+             bt.bestTime(lambda: AVLTree.from_sorted(snapshot, node_type=SlottedTreeNode))],
+        ]
+        print(f"n={n}")
+        bt.printTable(["build", "best s"], rows)
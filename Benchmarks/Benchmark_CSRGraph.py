@@ -0,0 +1,20 @@
+"""Adjacency-dict dijkstra vs dijkstra_csr: memory held by the graph and run time."""
+import BenchmarkTools as bt
+from DataStructures_Graphs import CSRGraph
+from Graph_problems import dijkstra, dijkstra_csr
+import random
+
+
+if __name__ == "__main__":
+    rng = random.Random(21)
+    rows = []
+    for numNodes, degree in ((100_000, 10), (200_000, 10)):
+        dictBytes, graph = bt.peakMemory(lambda: bt.randomGraph(numNodes, degree, rng=rng))
+        csrBytes, csr = bt.peakMemory(lambda: CSRGraph.from_adjacency(graph))
+        assert csr.to_labels(dijkstra_csr(csr, 0)) == dijkstra(graph, 0)
+        rows.append([numNodes, numNodes * degree, "dict of lists", dictBytes // 2**20,
+                     bt.bestTime(lambda: dijkstra(graph, 0), repeat=1)])
+        rows.append([numNodes, numNodes * degree, "CSRGraph", csrBytes // 2**20,
+                     bt.bestTime(lambda: dijkstra_csr(csr, 0), repeat=1)])
+        del graph, csr
+    bt.printTable(["V", "E", "graph", "graph MiB", "dijkstra s"], rows)
@@ -0,0 +1,24 @@
+"""Many-source dijkstra: a sequential loop vs dijkstra_many at increasing worker counts."""
+import BenchmarkTools as bt
+from DataStructures_Graphs import CSRGraph
+from Graph_problems import dijkstra_csr, dijkstra_many
+import os
+import random
+
+
+if __name__ == "__main__":
+    rng = random.Random(23)
+    numNodes, degree, numSources = 50_000, 8, 64
+    csr = CSRGraph.from_adjacency(bt.randomGraph(numNodes, degree, rng=rng))
+    sources = rng.sample(range(numNodes), numSources)
+    cores = os.cpu_count() or 1
+
+    sequential = bt.bestTime(lambda: [dijkstra_csr(csr, s) for s in sources], repeat=1)
+    rows = [["loop over dijkstra_csr", "-", sequential, 1.0]]
+    for workers in sorted({1, 2, 4, 8, cores}):
+        if workers > max(cores, 1):
+            continue
+        seconds = bt.bestTime(lambda: sum(1 for _ in dijkstra_many(csr, sources, max_workers=workers)), repeat=1)
+        rows.append(["dijkstra_many", workers, seconds, sequential / seconds])
+    print(f"V={numNodes}, E={numNodes * degree}, {numSources} sources, {cores} core(s) available")
+    bt.printTable(["method", "workers", "s", "speedup"], rows)
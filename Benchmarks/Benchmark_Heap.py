@@ -0,0 +1,61 @@
+"""Heap class vs the C-accelerated heapq module on the same workloads."""
+import BenchmarkTools as bt
+from DataStructures_Heap import Heap
+import heapq
+import random
+
+
+def heapPushPop(values):
+    heap = Heap()
+    for v in values:
+        heap.push(v)
+    return [heap.pop() for _ in range(len(values))]
+
+
+def heapqPushPop(values):
+    heap = []
+    for v in values:
+        heapq.heappush(heap, v)
+    return [heapq.heappop(heap) for _ in range(len(values))]
+
+
+def heapKeyed(values):
+    heap = Heap(values, key=lambda v: -v)
+    return [heap.pop() for _ in range(len(values))]
+
+
+def heapqKeyed(values):
+    heap = [(-v, i, v) for i, v in enumerate(values)]
+    heapq.heapify(heap)
+    return [heapq.heappop(heap)[2] for _ in range(len(values))]
+
+
+def heapStream(values, k):
+    heap = Heap(values[:k])
+    for v in values[k:]:
+        heap.pushpop(v)
+    return heap
+
+
+def heapqStream(values, k):
+    heap = values[:k]
+    heapq.heapify(heap)
+    for v in values[k:]:
+        heapq.heappushpop(heap, v)
+    return heap
+
+
+if __name__ == "__main__":
+    random.seed(15)
+    n = 100_000
+    values = [random.random() for _ in range(n)]
+    assert heapPushPop(values) == heapqPushPop(values) == sorted(values)
+    assert heapKeyed(values) == heapqKeyed(values)
+    rows = [
+        ["push n, pop n", bt.bestTime(lambda: heapPushPop(values)), bt.bestTime(lambda: heapqPushPop(values))],
+        ["heapify n", bt.bestTime(lambda: Heap(values)), bt.bestTime(lambda: heapq.heapify(list(values)))],
+        ["key=, heapify + pop n", bt.bestTime(lambda: heapKeyed(values)), bt.bestTime(lambda: heapqKeyed(values))],
+        ["pushpop stream, k=100", bt.bestTime(lambda: heapStream(values, 100)), bt.bestTime(lambda: heapqStream(values, 100))],
+    ]
+    print(f"n={n} random floats (heapq keyed = decorated tuples)")
+    bt.printTable(["workload", "Heap s", "heapq s"], rows)
@@ -0,0 +1,22 @@
+"""dijkstra with lazy duplicate heapq entries vs an IndexedHeap with decrease-key."""
+import BenchmarkTools as bt
+from Graph_problems import dijkstra
+import random
+
+
+if __name__ == "__main__":
+    rng = random.Random(16)
+    rows = []
+    for numNodes, degree in ((20_000, 5), (5_000, 50), (2_000, 400)):
+        graph = bt.randomGraph(numNodes, degree, rng=rng)
+        assert dijkstra(graph, 0) == dijkstra(graph, 0, indexed_heap=True)
+        for indexed in (False, True):
+            peak, _ = bt.allocationPeak(lambda: dijkstra(graph, 0, indexed_heap=indexed))
+            rows.append([
+                numNodes,
+                numNodes * degree,
+                "IndexedHeap" if indexed else "heapq + stale entries",
+                bt.bestTime(lambda: dijkstra(graph, 0, indexed_heap=indexed)),
+                peak // 1024,
+            ])
+    bt.printTable(["V", "E", "queue", "best s", "peak KiB"], rows)
@@ -0,0 +1,20 @@
+"""kruskal with a full sort vs streaming edge selection from a heap."""
+import BenchmarkTools as bt
+from Graph_problems import kruskal
+import random
+
+
+def randomEdges(numNodes, numEdges, rng):
+    return [(rng.random(), rng.randrange(numNodes), rng.randrange(numNodes)) for _ in range(numEdges)]
+
+
+if __name__ == "__main__":
+    rng = random.Random(24)
+    rows = []
+    for numNodes, numEdges in ((1_000, 500_000), (20_000, 500_000), (200_000, 500_000)):
+        edges = randomEdges(numNodes, numEdges, rng)
+        assert sorted(kruskal(edges, numNodes)) == sorted(kruskal(edges, numNodes, streaming=True))
+        for streaming in (False, True):
+            rows.append([numNodes, numEdges, "heap stream" if streaming else "full sort",
+                         bt.bestTime(lambda: kruskal(edges, numNodes, streaming=streaming), repeat=1)])
+    bt.printTable(["V", "E", "edge order", "best s"], rows)
@@ -0,0 +1,61 @@
+"""Work-queue patterns on LinkedList: drain from the back, FIFO, and bulk extend."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedSingleLinkedListNode
+from DataStructures_LinkedLists import LinkedList, DoublyLinkedList
+from collections import deque
+
+
+def drainBackNaive(lst):
+    """What draining cost before pop(): each tail delete walked from the head."""
+    while lst.size > 1:
+        prev = lst.head
+        while prev.next is not lst.tail:
+            prev = prev.next
+        prev.next = None
+        lst.tail = prev
+        lst.size -= 1
+
+
+def drainBack(lst):
+    while lst:
+        lst.pop()
+
+
+def fifo(lst, n):
+    for i in range(n):
+        lst.append(i)
+        if i & 1:
+            lst.popleft()
+
+
+def extendOneByOne(lst, items):
+    for item in items:
+        lst.insert_at_tail(item)
+
+
+def build(n):
+    return LinkedList(range(n), node_type=SlottedSingleLinkedListNode)
+
+
+if __name__ == "__main__":
+    rows = []
+    for n in (2_000, 8_000):
+        rows.append([n, "walk-to-tail delete", bt.bestTime(lambda: drainBackNaive(build(n)), repeat=1)])
+        rows.append([n, "LinkedList.pop", bt.bestTime(lambda: drainBack(build(n)), repeat=1)])
+    n = 500_000
+    rows.append([n, "LinkedList.pop", bt.bestTime(lambda: drainBack(build(n)), repeat=1)])
+    rows.append([n, "DoublyLinkedList.pop", bt.bestTime(lambda: drainBack(DoublyLinkedList(range(n))), repeat=1)])
+    rows.append([n, "deque.pop", bt.bestTime(lambda: drainBack(deque(range(n))), repeat=1)])
+    print("Drain from the back (includes build)")
+    bt.printTable(["n", "method", "seconds"], rows)
+
+    n = 500_000
+    items = list(range(n))
+    rows = [
+        ["LinkedList append/popleft", bt.bestTime(lambda: fifo(build(0), n), repeat=1)],
+        ["deque append/popleft", bt.bestTime(lambda: fifo(deque(), n), repeat=1)],
+        ["insert_at_tail per item", bt.bestTime(lambda: extendOneByOne(build(0), items))],
+        ["LinkedList.extend", bt.bestTime(lambda: build(0).extend(items))],
+    ]
+    print(f"Queue traffic and bulk extend, n={n}")
+    bt.printTable(["method", "seconds"], rows)
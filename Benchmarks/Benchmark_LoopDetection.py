@@ -0,0 +1,29 @@
+"""Loop detection: id()-dict ("visited") vs Floyd vs Brent, on acyclic and looped chains."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedSingleLinkedListNode, detectLoop
+from DataStructures_LinkedLists import LinkedList
+
+N = 1_000_000
+
+
+def buildChain(loopTo=None):
+    head = SlottedSingleLinkedListNode.fromIterable(range(N))
+    if loopTo is not None:
+        tail = head.findNodeByIndex(N)
+        tail.next = head.findNodeByIndex(loopTo + 1)
+    return head
+
+
+if __name__ == "__main__":
+    cases = [("acyclic", None), ("loop to index 0", 0), ("loop to index N/2", N // 2)]
+    rows = []
+    for label, loopTo in cases:
+        head = buildChain(loopTo)
+        for method in ("visited", "floyd", "brent"):
+            peak, result = bt.allocationPeak(lambda: detectLoop(head, method))
+            seconds = bt.bestTime(lambda: detectLoop(head, method))
+            rows.append([label, method, result, seconds, peak])
+        seconds = bt.bestTime(lambda: LinkedList.from_head(head), repeat=1)
+        rows.append([label, "LinkedList.from_head", "", seconds, ""])
+    print(f"Chains of N={N} slotted nodes")
+    bt.printTable(["chain", "method", "(count, loopIndex)", "seconds", "peak extra bytes"], rows)
@@ -0,0 +1,69 @@
+"""kruskal vs prim across edge densities, and MSTMaintainer vs recomputing after each change."""
+import BenchmarkTools as bt
+from Graph_problems import kruskal, prim, MSTMaintainer
+import random
+
+
+def randomUndirected(numNodes, density, rng):
+    """Edge list and matching adjacency dict with about density * V*(V-1)/2 edges."""
+    numEdges = max(numNodes - 1, int(density * numNodes * (numNodes - 1) / 2))
+    edges = [(rng.randint(1, 1000), rng.randrange(numNodes), rng.randrange(numNodes)) for _ in range(numEdges)]
+    graph = {node: [] for node in range(numNodes)}
+    for weight, a, b in edges:
+        graph[a].append((b, weight))
+        graph[b].append((a, weight))
+    return edges, graph
+
+
+def weight(mst):
+    return sum(edge[0] for edge in mst)
+
+
+if __name__ == "__main__":
+    rng = random.Random(25)
+    numNodes = 2_000
+    rows = []
+    for density in (0.001, 0.01, 0.1, 0.5):
+        edges, graph = randomUndirected(numNodes, density, rng)
+        assert weight(kruskal(edges, numNodes)) == weight(prim(graph))
+        kruskalTime = bt.bestTime(lambda: kruskal(edges, numNodes), repeat=1)
+        primTime = bt.bestTime(lambda: prim(graph), repeat=1)
+        rows.append([density, len(edges), kruskalTime, primTime, "kruskal" if kruskalTime < primTime else "prim"])
+    print(f"V={numNodes}")
+    bt.printTable(["density", "E", "kruskal s", "prim s", "faster"], rows)
+
+    edges, _ = randomUndirected(numNodes, 0.01, rng)
+    changes = []
+    current = list(edges)
+    for _ in range(200):
+        if rng.random() < 0.5:
+            edge = (rng.randint(1, 1000), rng.randrange(numNodes), rng.randrange(numNodes))
+            changes.append(("add", edge))
+            current.append(edge)
+        else:
+            edge = current.pop(rng.randrange(len(current)))
+            changes.append(("remove", edge))
+
+    def incremental():
+        maintainer = MSTMaintainer(edges, numNodes)
+        for kind, edge in changes:
+            (maintainer.add_edge if kind == "add" else maintainer.remove_edge)(*edge)
+        return maintainer.edges()
+
+    def recompute():
+        graphEdges = list(edges)
+        for kind, edge in changes:
+            if kind == "add":
+                graphEdges.append(edge)
+            else:
+                graphEdges.remove(edge)
+            mst = kruskal(graphEdges, numNodes)
+        return mst
+
+    assert weight(incremental()) == weight(recompute())
+    rows = [
+        ["MSTMaintainer", bt.bestTime(incremental, repeat=1)],
+        ["kruskal after every change", bt.bestTime(recompute, repeat=1)],
+    ]
+    print(f"V={numNodes}, E={len(edges)}, {len(changes)} edge changes")
+    bt.printTable(["method", "total s"], rows)
@@ -0,0 +1,50 @@
+"""Node comparison cost: historical deepcopy comparator vs cached rules vs sortKey."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import Node
+import copy
+import heapq
+import random
+
+N = 50_000
+
+
+class LegacyNode(Node):
+    """Reproduces the pre-rule comparator (deepcopy + isinstance chain per call)."""
+
+    def __lt__(self, other):
+        thisVal = copy.deepcopy(self.payload)
+        thatVal = copy.deepcopy(other.payload) if isinstance(other, Node) else copy.deepcopy(other)
+        if type(thisVal) != type(thatVal):
+            if isinstance(thisVal, str):
+                thatVal = str(thatVal)
+            elif isinstance(thisVal, bool):
+                thatVal = thatVal != "" if isinstance(thatVal, str) else thatVal != 0
+        if isinstance(thisVal, str) or isinstance(thisVal, bool):
+            raise TypeError(f"Unsupported ordering comparison for type {type(thisVal)}")
+        return thisVal < thatVal
+
+
+def heapDrain(nodes):
+    heap = [node.heapEntry(i) for i, node in enumerate(nodes)]
+    heapq.heapify(heap)
+    return [heapq.heappop(heap)[2] for _ in range(len(heap))]
+
+
+def run(label, payloads):
+    legacy = [LegacyNode(p) for p in payloads]
+    nodes = [Node(p) for p in payloads]
+    rows = [
+        ["sorted(payloads)", bt.bestTime(lambda: sorted(payloads))],
+        ["sorted(legacy nodes)", bt.bestTime(lambda: sorted(legacy), repeat=1)],
+        ["sorted(nodes)", bt.bestTime(lambda: sorted(nodes))],
+        ["sorted(nodes, key=Node.sortKey)", bt.bestTime(lambda: sorted(nodes, key=Node.sortKey))],
+        ["heapq via heapEntry", bt.bestTime(lambda: heapDrain(nodes))],
+    ]
+    print(f"{label}, N={len(payloads)}")
+    bt.printTable(["operation", "seconds"], rows)
+
+
+if __name__ == "__main__":
+    random.seed(2)
+    run("int payloads", [random.randrange(10**9) for _ in range(N)])
+    run("list payloads", [[random.randrange(100) for _ in range(8)] for _ in range(N // 5)])
@@ -0,0 +1,80 @@
+"""Per-node memory and traversal time: dict-backed nodes vs the slotted family."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import (
+    SingleLinkedListNode, DoublyLinkedListNode, TreeNode,
+    SlottedSingleLinkedListNode, SlottedDoublyLinkedListNode, SlottedTreeNode,
+)
+from DataStructures_LinkedLists import LinkedList, DoublyLinkedList
+from DataStructures_Trees import BinaryTree
+import random
+
+N = 200_000
+
+
+def walkNext(head):
+    count = 0
+    node = head
+    while node is not None:
+        count += 1
+        node = node.Next()
+    return count
+
+
+def walkAttr(head):
+    count = 0
+    node = head
+    while node is not None:
+        count += 1
+        node = node.next
+    return count
+
+
+def benchListNodes():
+    rows = []
+    for nodeCls in (SingleLinkedListNode, SlottedSingleLinkedListNode,
+                    DoublyLinkedListNode, SlottedDoublyLinkedListNode):
+        memory, head = bt.peakMemory(lambda: nodeCls.fromIterable(range(N)))
+        rows.append([
+            nodeCls.__name__,
+            memory // N,
+            bt.bestTime(lambda: walkNext(head)),
+            bt.bestTime(lambda: walkAttr(head)),
+        ])
+    print(f"Linked-list nodes, N={N}")
+    bt.printTable(["node class", "bytes/node", "Next() walk s", ".next walk s"], rows)
+
+
+def benchContainers():
+    rows = []
+    for listCls, nodeCls in ((LinkedList, SingleLinkedListNode),
+                             (LinkedList, SlottedSingleLinkedListNode),
+                             (DoublyLinkedList, DoublyLinkedListNode),
+                             (DoublyLinkedList, SlottedDoublyLinkedListNode)):
+        build = bt.bestTime(lambda: listCls(range(N), node_type=nodeCls))
+        lst = listCls(range(N), node_type=nodeCls)
+        rows.append([listCls.__name__, nodeCls.__name__, build, bt.bestTime(lambda: sum(lst))])
+    print(f"List containers, N={N}")
+    bt.printTable(["list", "node class", "build s", "iterate s"], rows)
+
+
+def benchTrees():
+    keys = list(range(N // 4))
+    random.seed(1)
+    random.shuffle(keys)
+    rows = []
+    for nodeCls in (TreeNode, SlottedTreeNode):
+        memory, tree = bt.peakMemory(lambda: BinaryTree(keys, node_type=nodeCls))
+        rows.append([
+            nodeCls.__name__,
+            memory // len(keys),
+            bt.bestTime(lambda: BinaryTree(keys, node_type=nodeCls), repeat=1),
+            bt.bestTime(lambda: [tree.find(k) for k in keys], repeat=1),
+        ])
+    print(f"BinaryTree with random keys, N={len(keys)}")
+    bt.printTable(["node class", "bytes/node", "build s", "find all s"], rows)
+
+
+if __name__ == "__main__":
+    benchListNodes()
+    benchContainers()
+    benchTrees()
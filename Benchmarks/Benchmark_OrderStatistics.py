@@ -0,0 +1,40 @@
+"""rank/select/count_range from cached subtree sizes vs materializing inorder_list()."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedTreeNode
+from DataStructures_Trees import AVLTree
+import bisect
+import random
+
+N = 200_000
+QUERIES = 2_000
+
+
+def viaInorder(tree, queries):
+    values = tree.inorder_list()
+    for lo, hi, k in queries:
+        bisect.bisect_left(values, lo)
+        values[k - 1]
+        bisect.bisect_right(values, hi) - bisect.bisect_left(values, lo)
+
+
+def viaCachedSizes(tree, queries):
+    for lo, hi, k in queries:
+        tree.rank(lo)
+        tree.select(k)
+        tree.count_range(lo, hi)
+
+
+if __name__ == "__main__":
+    random.seed(13)
+    tree = AVLTree(random.sample(range(N * 4), N), node_type=SlottedTreeNode)
+    queries = []
+    for _ in range(QUERIES):
+        lo = random.randrange(N * 4)
+        queries.append((lo, lo + random.randrange(N), random.randrange(1, N + 1)))
+    rows = [
+        ["inorder_list() once + bisect", bt.bestTime(lambda: viaInorder(tree, queries), repeat=1)],
+        ["rank/select/count_range", bt.bestTime(lambda: viaCachedSizes(tree, queries), repeat=1)],
+        ["getHeight() x 100000", bt.bestTime(lambda: [tree.root.getHeight() for _ in range(100_000)], repeat=1)],
+    ]
+    print(f"AVLTree with N={N}, {QUERIES} (rank, select, count_range) query triples")
+    bt.printTable(["method", "seconds"], rows)
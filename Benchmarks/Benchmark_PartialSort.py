@@ -0,0 +1,23 @@
+"""Top page of results: heapSort(partial=k) vs fully sorting the array."""
+import BenchmarkTools as bt
+import Sorters
+import heapq
+import random
+
+
+if __name__ == "__main__":
+    random.seed(20)
+    n = 200_000
+    data = [random.random() for _ in range(n)]
+    copy = lambda: list(data)
+    rows = [
+        ["full", "heapSort", bt.bestTimeWithSetup(copy, Sorters.heapSort, repeat=1)],
+        ["full", "hybridSort", bt.bestTimeWithSetup(copy, Sorters.hybridSort, repeat=1)],
+    ]
+    for k in (10, 100, 1_000):
+        assert Sorters.heapSort(list(data), partial=k)[:k] == sorted(data)[:k]
+        rows.append([k, "heapSort partial=k", bt.bestTimeWithSetup(copy, lambda arr: Sorters.heapSort(arr, partial=k))])
+        rows.append([k, "heapSort key= partial=k", bt.bestTimeWithSetup(copy, lambda arr: Sorters.heapSort(arr, key=abs, partial=k))])
+        rows.append([k, "heapq.nsmallest", bt.bestTime(lambda: heapq.nsmallest(k, data))])
+    print(f"n={n} random floats")
+    bt.printTable(["k", "method", "best s"], rows)
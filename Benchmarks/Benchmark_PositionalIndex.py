@@ -0,0 +1,33 @@
+"""Positional edits: head-walking LinkedList vs indexed LinkedList vs DoublyLinkedList."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedSingleLinkedListNode, SlottedDoublyLinkedListNode
+from DataStructures_LinkedLists import LinkedList, DoublyLinkedList
+import random
+
+OPS = 5_000
+
+
+def positionalBatch(lst, ops):
+    for kind, index in ops:
+        if kind == 0:
+            lst.insert_at(min(index, lst.size + 1), index)
+        elif kind == 1:
+            lst.delete_at(min(index, lst.size))
+        else:
+            lst.get(min(index, lst.size))
+
+
+if __name__ == "__main__":
+    random.seed(4)
+    for size in (10_000, 100_000):
+        ops = [(random.randrange(3), random.randrange(1, size)) for _ in range(OPS)]
+        variants = [
+            ("LinkedList", lambda: LinkedList(range(size), node_type=SlottedSingleLinkedListNode)),
+            ("LinkedList(indexed=True)", lambda: LinkedList(range(size), node_type=SlottedSingleLinkedListNode, indexed=True)),
+            ("DoublyLinkedList", lambda: DoublyLinkedList(range(size), node_type=SlottedDoublyLinkedListNode)),
+        ]
+        rows = []
+        for name, build in variants:
+            rows.append([name, bt.bestTime(build, repeat=1), bt.bestTime(lambda: positionalBatch(build(), ops), repeat=1)])
+        print(f"{OPS} random insert_at/delete_at/get on a list of {size} (slotted nodes)")
+        bt.printTable(["list", "build s", "build + batch s"], rows)
@@ -0,0 +1,30 @@
+"""radixSort vs sorted() (and np.sort when NumPy is installed) on signed integers."""
+import BenchmarkTools as bt
+import Sorters
+import random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+if __name__ == "__main__":
+    random.seed(19)
+    rows = []
+    for n, bits in ((100_000, 16), (1_000_000, 32), (1_000_000, 62)):
+        data = [random.randrange(-(1 << bits), 1 << bits) for _ in range(n)]
+        assert Sorters.radixSort(list(data)) == sorted(data)
+        row = [n, bits, bt.bestTimeWithSetup(lambda: list(data), Sorters.radixSort, repeat=1),
+               bt.bestTime(lambda: sorted(data), repeat=1)]
+        if np is not None:
+            asArray = np.array(data, dtype=np.int64)
+            row.append(bt.bestTime(lambda: Sorters.radixSort(asArray.copy()), repeat=1))
+            row.append(bt.bestTime(lambda: np.sort(asArray), repeat=1))
+        rows.append(row)
+    headers = ["n", "value bits", "radixSort(list) s", "sorted() s"]
+    if np is not None:
+        headers += ["radixSort(ndarray) s", "np.sort s"]
+    else:
+        print("NumPy not installed: radixSort uses its pure-Python path")
+    bt.printTable(headers, rows)
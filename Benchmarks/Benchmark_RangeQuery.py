@@ -0,0 +1,29 @@
+"""Narrow range queries: filtering inorder() vs the pruned range() generator."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedTreeNode
+from DataStructures_Trees import AVLTree
+import random
+
+
+def filterInorder(tree, queries):
+    return [[v for v in tree.inorder() if lo <= v <= hi] for lo, hi in queries]
+
+
+def rangeQueries(tree, queries):
+    return [list(tree.range(lo, hi)) for lo, hi in queries]
+
+
+if __name__ == "__main__":
+    random.seed(13)
+    for n in (10_000, 100_000):
+        tree = AVLTree.from_sorted(range(n), node_type=SlottedTreeNode)
+        rows = []
+        for width in (10, 1_000):
+            queries = [(lo, lo + width) for lo in (random.randrange(n) for _ in range(20))]
+            assert filterInorder(tree, queries) == rangeQueries(tree, queries)
+            rows.append([width, "inorder + filter", bt.bestTime(lambda: filterInorder(tree, queries), repeat=1)])
+            rows.append([width, "range(lo, hi)", bt.bestTime(lambda: rangeQueries(tree, queries))])
+        firstTen = lambda: [v for v, _ in zip(tree.range(n // 2), range(10))]
+        rows.append(["open", "first 10 of range(lo)", bt.bestTime(firstTen)])
+        print(f"n={n}, 20 queries per row")
+        bt.printTable(["width", "method", "best s"], rows)
@@ -0,0 +1,57 @@
+"""Point-to-point queries: full dijkstra vs early-exit, bidirectional and A* shortest_path."""
+import BenchmarkTools as bt
+from Graph_problems import dijkstra, shortest_path, reverse_adjacency
+import random
+
+
+def gridGraph(side, rng):
+    """4-neighbour grid with weights >= 1, so Manhattan distance is a consistent heuristic."""
+    graph = {}
+    for x in range(side):
+        for y in range(side):
+            edges = []
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < side and 0 <= ny < side:
+                    edges.append(((nx, ny), rng.randint(1, 10)))
+            graph[(x, y)] = edges
+    return graph
+
+
+def manhattan(node, target):
+    return abs(node[0] - target[0]) + abs(node[1] - target[1])
+
+
+def compare(name, graph, queries, heuristic=None):
+    reverse = reverse_adjacency(graph)
+    methods = ["dijkstra", "bidirectional"] + (["astar"] if heuristic else [])
+    rows = []
+    settledFull = 0
+    for src, _ in queries:
+        settledFull += sum(1 for d in dijkstra(graph, src).values() if d != float("inf"))
+    fullTime = bt.bestTime(lambda: [dijkstra(graph, src) for src, _ in queries], repeat=1)
+    rows.append([name, "full dijkstra", settledFull // len(queries), 1000 * fullTime / len(queries)])
+    for method in methods:
+        settled = 0
+        for src, dst in queries:
+            stats = {}
+            distance, _ = shortest_path(graph, src, dst, method=method, heuristic=heuristic,
+                                        reverse_graph=reverse, stats=stats)
+            assert distance == dijkstra(graph, src)[dst]
+            settled += stats["settled"]
+        run = lambda: [shortest_path(graph, src, dst, method=method, heuristic=heuristic, reverse_graph=reverse)
+                       for src, dst in queries]
+        rows.append([name, method, settled // len(queries), 1000 * bt.bestTime(run, repeat=1) / len(queries)])
+    return rows
+
+
+if __name__ == "__main__":
+    rng = random.Random(22)
+    rows = []
+    side = 150
+    grid = gridGraph(side, rng)
+    nodes = list(grid)
+    rows += compare(f"grid {side}x{side}", grid, [(rng.choice(nodes), rng.choice(nodes)) for _ in range(10)], manhattan)
+    numNodes = 50_000
+    sparse = bt.randomGraph(numNodes, 4, rng=rng)
+    rows += compare(f"random V={numNodes}", sparse, [(rng.randrange(numNodes), rng.randrange(numNodes)) for _ in range(10)])
+    bt.printTable(["graph", "method", "avg settled", "avg ms"], rows)
@@ -0,0 +1,44 @@
+"""hybridSort vs the other Sorters.py functions and sorted() on common input shapes."""
+import BenchmarkTools as bt
+import Sorters
+import random
+
+
+def inputs(n):
+    data = [random.randrange(n) for _ in range(n)]
+    return {
+        "random": data,
+        "sorted": sorted(data),
+        "reversed": sorted(data, reverse=True),
+        "few unique": [random.randrange(4) for _ in range(n)],
+    }
+
+
+def timeSorts(n, sorters, repeat):
+    rows = []
+    for shape, data in inputs(n).items():
+        expected = sorted(data)
+        row = [shape]
+        for sorter in sorters.values():
+            assert sorter(list(data)) == expected
+            row.append(bt.bestTimeWithSetup(lambda: list(data), sorter, repeat=repeat))
+        rows.append(row)
+    print(f"n={n}, seconds")
+    bt.printTable(["input"] + list(sorters), rows)
+
+
+if __name__ == "__main__":
+    random.seed(18)
+    timeSorts(2_000, {
+        "selectorSort": Sorters.selectorSort,
+        "bubbleSort": Sorters.bubbleSort,
+        "mergeSort": Sorters.mergeSort,
+        "hybridSort": Sorters.hybridSort,
+    }, repeat=1)
+    timeSorts(200_000, {
+        "mergeSort": Sorters.mergeSort,
+        "heapSort": Sorters.heapSort,
+        "hybridSort": Sorters.hybridSort,
+        "hybridSort key=": lambda arr: Sorters.hybridSort(arr, key=abs),
+        "sorted()": sorted,
+    }, repeat=1)
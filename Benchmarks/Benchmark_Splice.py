@@ -0,0 +1,45 @@
+"""Bulk relinking vs per-element copying for merge, split and sub-range access."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedSingleLinkedListNode, SlottedDoublyLinkedListNode
+from DataStructures_LinkedLists import LinkedList, DoublyLinkedList
+
+N = 200_000
+
+
+def copyConcat(a, b):
+    for item in b:
+        a.insert_at_tail(item)
+
+
+def copySplit(a, index):
+    rest = type(a)(node_type=a.NodeType)
+    for item in a.slice(index + 1, a.size + 1):
+        rest.insert_at_tail(item)
+    while a.size > index:
+        a.delete_at_tail()
+    return rest
+
+
+def copySlice(a, start, stop):
+    return type(a)((item for pos, item in enumerate(a, 1) if start <= pos < stop), node_type=a.NodeType)
+
+
+if __name__ == "__main__":
+    for listCls, nodeCls in ((LinkedList, SlottedSingleLinkedListNode),
+                             (DoublyLinkedList, SlottedDoublyLinkedListNode)):
+        def build():
+            return listCls(range(N), node_type=nodeCls)
+
+        def buildPair():
+            return build(), build()
+
+        rows = [
+            ["concat by insert_at_tail", bt.bestTimeWithSetup(buildPair, lambda ab: copyConcat(*ab))],
+            ["concat()", bt.bestTimeWithSetup(buildPair, lambda ab: ab[0].concat(ab[1]))],
+            ["split in half by copying", bt.bestTimeWithSetup(build, lambda a: copySplit(a, N // 2))],
+            ["split_at()", bt.bestTimeWithSetup(build, lambda a: a.split_at(N // 2))],
+            ["middle 10% by copying", bt.bestTimeWithSetup(build, lambda a: copySlice(a, N // 2, N // 2 + N // 10))],
+            ["slice() + iterate", bt.bestTimeWithSetup(build, lambda a: sum(a.slice(N // 2, N // 2 + N // 10)))],
+        ]
+        print(f"{listCls.__name__}, N={N} per list (list construction not timed)")
+        bt.printTable(["operation", "seconds"], rows)
@@ -0,0 +1,39 @@
+"""Rendering a huge list: str() vs streaming write vs truncated rendering."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedSingleLinkedListNode
+from DataStructures_LinkedLists import LinkedList
+import os
+
+N = 2_000_000
+
+
+class CountingSink:
+    """File-like object that only counts characters, so output is not retained."""
+
+    def __init__(self):
+        self.chars = 0
+
+    def write(self, text):
+        self.chars += len(text)
+
+
+def writeDevnull(lst):
+    with open(os.devnull, "w") as stream:
+        lst.write(stream)
+
+
+if __name__ == "__main__":
+    lst = LinkedList(range(N), node_type=SlottedSingleLinkedListNode)
+    cases = [
+        ("len(str(list))", lambda: len(str(lst))),
+        ("list.write(sink)", lambda: lst.write(CountingSink())),
+        ("list.write(devnull)", lambda: writeDevnull(lst)),
+        ("list.write(sink, max_items=20)", lambda: lst.write(CountingSink(), max_items=20)),
+        ("strChain(maxItems=20)", lambda: lst.head.strChain(maxItems=20)),
+    ]
+    rows = []
+    for label, func in cases:
+        peak, _result = bt.allocationPeak(func)
+        rows.append([label, bt.bestTime(func, repeat=1), peak])
+    print(f"LinkedList of N={N} slotted nodes")
+    bt.printTable(["rendering", "seconds", "peak extra bytes"], rows)
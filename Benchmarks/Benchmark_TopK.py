@@ -0,0 +1,29 @@
+"""k smallest of a LinkedList stream: TopK vs sorting everything vs heapq.nsmallest."""
+import BenchmarkTools as bt
+from DataStructures_Heap import TopK
+from DataStructures_LinkedLists import LinkedList
+from DataStructures_Nodes import SlottedSingleLinkedListNode
+import heapq
+import random
+
+
+if __name__ == "__main__":
+    random.seed(17)
+    n = 1_000_000
+    stream = LinkedList((random.random() for _ in range(n)), node_type=SlottedSingleLinkedListNode)
+    chunks = [LinkedList(stream.slice(1 + i * n // 4, 1 + (i + 1) * n // 4)) for i in range(4)]
+    rows = []
+    for k in (10, 1_000):
+        methods = {
+            "sorted(...)[:k]": lambda: sorted(stream)[:k],
+            "heapq.nsmallest": lambda: heapq.nsmallest(k, stream),
+            "TopK": lambda: TopK(k, iterable=stream).result(),
+            "TopK x4 chunks + merge": lambda: TopK(k).merge(*(TopK(k, iterable=c) for c in chunks)).result(),
+        }
+        expected = sorted(stream)[:k]
+        for name, method in methods.items():
+            peak, result = bt.allocationPeak(method)
+            assert result == expected
+            rows.append([k, name, bt.bestTime(method, repeat=1), peak // 1024])
+    print(f"n={n} floats streamed from a LinkedList")
+    bt.printTable(["k", "method", "best s", "peak KiB"], rows)
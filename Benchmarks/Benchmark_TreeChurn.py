@@ -0,0 +1,55 @@
+"""Insert/delete churn: rebuild-from-filter vs delete(), with and without a node pool."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import TreeNode, SlottedTreeNode
+from DataStructures_Trees import BinaryTree, AVLTree
+import random
+
+
+def churnByRebuild(tree, ops):
+    for old, new in ops:
+        tree = BinaryTree.from_sorted([v for v in tree.inorder() if v != old], node_type=tree.NodeType)
+        tree.insert(new)
+    return tree
+
+
+def churnByDelete(tree, ops):
+    for old, new in ops:
+        tree.delete(old)
+        tree.insert(new)
+    return tree
+
+
+def makeOps(keys, count):
+    """Replace a random live key by a random unused one, `count` times."""
+    live = list(keys)
+    liveSet = set(live)
+    ops = []
+    for _ in range(count):
+        new = random.random()
+        while new in liveSet:
+            new = random.random()
+        i = random.randrange(len(live))
+        ops.append((live[i], new))
+        liveSet.discard(live[i])
+        liveSet.add(new)
+        live[i] = new
+    return ops
+
+
+if __name__ == "__main__":
+    random.seed(14)
+    n = 20_000
+    keys = [random.random() for _ in range(n)]
+    ops = makeOps(keys, 20_000)
+    rows = []
+    rebuildOps = ops[:20]
+    seconds = bt.bestTimeWithSetup(lambda: BinaryTree(keys), lambda t: churnByRebuild(t, rebuildOps), repeat=1)
+    rows.append(["BinaryTree", "TreeNode", "rebuild", "-", 1e6 * seconds / len(rebuildOps)])
+    for treeCls in (BinaryTree, AVLTree):
+        for nodeType in (TreeNode, SlottedTreeNode):
+            for poolSize in (0, 64):
+                setup = lambda: treeCls(keys, node_type=nodeType, pool_size=poolSize)
+                seconds = bt.bestTimeWithSetup(setup, lambda t: churnByDelete(t, ops))
+                rows.append([treeCls.__name__, nodeType.__name__, "delete+insert", poolSize, 1e6 * seconds / len(ops)])
+    print(f"n={n} live keys, each op deletes one key and inserts a new one")
+    bt.printTable(["tree", "node", "method", "pool", "us per op"], rows)
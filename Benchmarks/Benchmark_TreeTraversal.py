@@ -0,0 +1,47 @@
+"""Recursive `yield from` traversal (previous implementation) vs the explicit-stack one."""
+import BenchmarkTools as bt
+from DataStructures_Nodes import SlottedTreeNode
+from DataStructures_Trees import BinaryTree, AVLTree
+import random
+
+
+def legacyInorder(node, seen=None):
+    """The previous BinaryTree.inorder: recursive generators plus a seen-set."""
+    if node is None:
+        return
+    if seen is None:
+        seen = set()
+    if id(node) in seen:
+        return
+    seen.add(id(node))
+    yield from legacyInorder(node.left, seen)
+    yield node.payload
+    yield from legacyInorder(node.right, seen)
+
+
+def consume(iterator):
+    for _ in iterator:
+        pass
+
+
+if __name__ == "__main__":
+    random.seed(12)
+    trees = [
+        ("degenerate, n=900", BinaryTree(range(900), node_type=SlottedTreeNode)),
+        ("degenerate, n=3000", BinaryTree(range(3000), node_type=SlottedTreeNode)),
+        ("AVL, n=200000", AVLTree(random.sample(range(200_000), 200_000), node_type=SlottedTreeNode)),
+    ]
+    rows = []
+    for label, tree in trees:
+        try:
+            legacy = bt.bestTime(lambda: consume(legacyInorder(tree.root)), repeat=1)
+        except RecursionError:
+            legacy = "RecursionError"
+        rows.append([
+            label,
+            legacy,
+            bt.bestTime(lambda: consume(tree.inorder())),
+            bt.bestTime(lambda: consume(tree.inorder(detect_cycles=True))),
+            bt.bestTime(lambda: consume(tree.postorder())),
+        ])
+    bt.printTable(["tree", "recursive inorder s", "inorder s", "inorder(detect_cycles) s", "postorder s"], rows)
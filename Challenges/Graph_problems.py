@@ -1,62 +1,240 @@
-def kruskal(edges, num_nodes):
+import os
+import sys
+
+# Resolve Algorithms/ next to this file, so the data-structure imports work
+# from any working directory and on any platform.
+_ALGORITHMS = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Algorithms"))
+if _ALGORITHMS not in sys.path:
+    sys.path.append(_ALGORITHMS)
+
+from DataStructures_DisjointSet import DisjointSet
+
+def kruskal(edges, num_nodes, streaming=False):
     """
     Implements Kruskal's algorithm to find the Minimum Spanning Tree (MST) of a graph.
 
     Parameters:
     edges (list of tuples): A list where each tuple represents an edge in the format (weight, node1, node2).
+        Nodes are ints in range(num_nodes). The list is not modified.
     num_nodes (int): The number of nodes in the graph.
+    streaming (bool): Instead of sorting all edges, heapify a copy of the list in O(E) and pop edges
+        only until the MST is complete. Pays off on huge edge lists where the MST is found long
+        before the heaviest edges are reached. Equal weights are then ordered by node ids rather
+        than by position, which can pick a different (equally light) tree.
 
     Returns:
-    list of tuples: A list of edges that form the MST.
+    list of tuples: A list of edges that form the MST (a spanning forest if the graph is disconnected).
     """
-    # Sort edges based on their weights
-    edges.sort(key=lambda x: x[0])
+    if streaming:
+        import heapq
 
-    parent = list(range(num_nodes))
-    rank = [0] * num_nodes
+        min_heap = list(edges)
+        heapq.heapify(min_heap)
+        ordered = (heapq.heappop(min_heap) for _ in range(len(min_heap)))
+    else:
+        ordered = sorted(edges, key=lambda x: x[0])
 
-    def find(node):
-        if parent[node] != node:
-            parent[node] = find(parent[node])
-        return parent[node]
+    components = DisjointSet(num_nodes)
+    target = num_nodes - 1
+    mst = []
+    for weight, node1, node2 in ordered:
+        if components.union(node1, node2):
+            mst.append((weight, node1, node2))
+            if len(mst) == target:
+                break
+
+    return mst
 
-    def union(node1, node2):
-        root1 = find(node1)
-        root2 = find(node2)
+def prim(graph):
+    """
+    Implements Prim's algorithm in its O(V^2 + E) array form: no edge sort, and it runs directly on the
+    adjacency dict that dijkstra uses. See Benchmarks/Benchmark_MST.py for how it compares with kruskal.
 
-        if root1 != root2:
-            if rank[root1] > rank[root2]:
-                parent[root2] = root1
-            elif rank[root1] < rank[root2]:
-                parent[root1] = root2
-            else:
-                parent[root2] = root1
-                rank[root1] += 1
+    Parameters:
+    graph (dict): An undirected graph in the dijkstra format: keys are node identifiers and values are
+        lists of tuples (neighbor, weight), with every edge listed under both of its endpoints.
 
+    Returns:
+    list of tuples: MST edges as (weight, tree_node, new_node), in the order they were added (a spanning
+        forest if the graph is disconnected).
+    """
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+    best = [float('inf')] * n  # lightest known edge from the tree to each node
+    via = [0] * n
+    visited = bytearray(n)
     mst = []
-    for weight, node1, node2 in edges:
-        if find(node1) != find(node2):
-            union(node1, node2)
-            mst.append((weight, node1, node2))
+
+    for _ in range(n):
+        # min() and index() scan in C, so picking the next node costs O(V) without a heap.
+        lightest = min(best)
+        if lightest == float('inf'):
+            current = visited.find(0)  # nothing reachable is left: start a new tree
+        else:
+            current = best.index(lightest)
+            mst.append((lightest, nodes[via[current]], nodes[current]))
+        visited[current] = 1
+        best[current] = float('inf')
+
+        for neighbor, weight in graph[nodes[current]]:
+            target = index[neighbor]
+            if not visited[target] and weight < best[target]:
+                best[target] = weight
+                via[target] = current
 
     return mst
 
-def dijkstra(graph, start):
+class MSTMaintainer:
+    """
+    Keeps a minimum spanning forest up to date while edges are added and removed.
+
+    Edges use the kruskal format (weight, node1, node2) with nodes in range(num_nodes); the same tuple
+    may be added more than once. The initial forest comes from kruskal.
+
+    - add_edge: O(V). If the new edge closes a cycle in the forest, it replaces the heaviest edge on
+      that cycle when it is lighter.
+    - remove_edge: O(V) for a non-tree edge, O(V + E) for a tree edge, which is cut and then
+      replaced by the lightest remaining edge that reconnects the two sides, if any.
+    """
+
+    def __init__(self, edges, num_nodes):
+        self.num_nodes = num_nodes
+        self._counts = {}  # every current graph edge -> multiplicity
+        for edge in edges:
+            self._counts[edge] = self._counts.get(edge, 0) + 1
+        self._tree = [dict() for _ in range(num_nodes)]  # node -> {neighbor: tree edge}
+        self._tree_edges = set()
+        for edge in kruskal(edges, num_nodes):
+            self._link(edge)
+
+    def edges(self):
+        """The current forest as a list of (weight, node1, node2)."""
+        return list(self._tree_edges)
+
+    def total_weight(self):
+        return sum(edge[0] for edge in self._tree_edges)
+
+    def add_edge(self, weight, node1, node2):
+        """Add an edge to the graph; returns True if the forest changed."""
+        edge = (weight, node1, node2)
+        self._counts[edge] = self._counts.get(edge, 0) + 1
+        if node1 == node2 or edge in self._tree_edges:
+            return False
+        path = self._tree_path(node1, node2)
+        if path is None:
+            self._link(edge)
+            return True
+        heaviest = max(path, key=lambda e: e[0])
+        if weight < heaviest[0]:
+            self._cut(heaviest)
+            self._link(edge)
+            return True
+        return False
+
+    def remove_edge(self, weight, node1, node2):
+        """Remove one copy of an edge from the graph; returns True if the forest changed."""
+        edge = (weight, node1, node2)
+        count = self._counts.get(edge)
+        if count is None:
+            raise ValueError(f"edge {edge} is not in the graph")
+        if count > 1:
+            # An identical copy stays, so the forest can keep using it.
+            self._counts[edge] = count - 1
+            return False
+        del self._counts[edge]
+        if edge not in self._tree_edges:
+            return False
+        self._cut(edge)
+        side = self._component(node1)
+        replacement = None
+        for candidate in self._counts:
+            if (candidate[1] in side) != (candidate[2] in side):
+                if replacement is None or candidate[0] < replacement[0]:
+                    replacement = candidate
+        if replacement is not None:
+            self._link(replacement)
+        return True
+
+    def _link(self, edge):
+        _, node1, node2 = edge
+        self._tree[node1][node2] = edge
+        self._tree[node2][node1] = edge
+        self._tree_edges.add(edge)
+
+    def _cut(self, edge):
+        _, node1, node2 = edge
+        del self._tree[node1][node2]
+        del self._tree[node2][node1]
+        self._tree_edges.discard(edge)
+
+    def _tree_path(self, start, goal):
+        """Tree edges on the forest path from start to goal, or None if they are not connected."""
+        parent_edge = {start: None}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                path = []
+                while parent_edge[node] is not None:
+                    edge = parent_edge[node]
+                    path.append(edge)
+                    node = edge[1] if edge[2] == node else edge[2]
+                return path
+            for neighbor, edge in self._tree[node].items():
+                if neighbor not in parent_edge:
+                    parent_edge[neighbor] = edge
+                    stack.append(neighbor)
+        return None
+
+    def _component(self, start):
+        seen = {start}
+        stack = [start]
+        while stack:
+            for neighbor in self._tree[stack.pop()]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return seen
+
+def dijkstra(graph, start, indexed_heap=False):
     """
     Implements Dijkstra's algorithm to find the shortest paths from a starting node to all other nodes in a weighted graph.
 
     Parameters:
     graph (dict): A dictionary where keys are node identifiers and values are lists of tuples (neighbor, weight).
     start: The starting node identifier.
+    indexed_heap (bool): Use an IndexedHeap with decrease-key, so the queue holds at most one
+        entry per node (O(V) memory) instead of one per relaxed edge (O(E)).
 
     Returns:
     dict: A dictionary with the shortest distance from the start node to each node.
     """
+    distances = {node: float('inf') for node in graph}
+    distances[start] = 0
+
+    if indexed_heap:
+        from DataStructures_Heap import IndexedHeap
+
+        queue = IndexedHeap([(start, 0)])
+        while queue:
+            current_node, current_distance = queue.pop()
+
+            for neighbor, weight in graph[current_node]:
+                distance = current_distance + weight
+
+                if distance < distances[neighbor]:
+                    if neighbor in queue:
+                        queue.decrease_key(neighbor, distance)
+                    else:
+                        queue.push(neighbor, distance)
+                    distances[neighbor] = distance
+
+        return distances
+
     import heapq
 
     min_heap = [(0, start)]
-    distances = {node: float('inf') for node in graph}
-    distances[start] = 0
 
     while min_heap:
         current_distance, current_node = heapq.heappop(min_heap)
@@ -71,4 +249,272 @@ def dijkstra(graph, start):
                 distances[neighbor] = distance
                 heapq.heappush(min_heap, (distance, neighbor))
 
-    return distances
\ No newline at end of file
+    return distances
+
+def dijkstra_csr(csr, start):
+    """
+    Dijkstra's algorithm on a CSRGraph (see DataStructures_Graphs).
+
+    Parameters:
+    csr (CSRGraph): The graph, e.g. CSRGraph.from_adjacency(graph).
+    start: The starting node identifier (an original id, not a dense int).
+
+    Returns:
+    list: The shortest distance to each dense node id; csr.to_labels(result) gives the dict that dijkstra returns.
+    """
+    return _dijkstra_dense(csr.offsets, csr.targets, csr.weights, csr.index[start])
+
+def _dijkstra_dense(offsets, targets, weights, source):
+    """dijkstra_csr on raw CSR buffers (arrays or memoryviews) from a dense source id."""
+    import heapq
+
+    num_nodes = len(offsets) - 1
+    distances = [float('inf')] * num_nodes
+    distances[source] = 0
+    settled = bytearray(num_nodes)
+    min_heap = [(0, source)]
+    heappop, heappush = heapq.heappop, heapq.heappush
+
+    while min_heap:
+        current_distance, current_node = heappop(min_heap)
+
+        # A byte lookup is cheaper than comparing against the stored distance.
+        if settled[current_node]:
+            continue
+        settled[current_node] = 1
+
+        lo, hi = offsets[current_node], offsets[current_node + 1]
+        for neighbor, weight in zip(targets[lo:hi], weights[lo:hi]):
+            distance = current_distance + weight
+
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                heappush(min_heap, (distance, neighbor))
+
+    return distances
+
+def dijkstra_many(graph, sources, max_workers=None, chunksize=None):
+    """
+    Runs Dijkstra from many sources in parallel over a ProcessPoolExecutor.
+
+    The graph is converted to CSR form once and written to a temporary file that every worker
+    memory-maps read-only, so it is never pickled per task. Each task runs a chunk of sources.
+
+    Parameters:
+    graph (dict or CSRGraph): The graph, in the dijkstra dict format or as a CSRGraph.
+    sources (iterable): The starting node identifiers.
+    max_workers (int): Worker processes; defaults to os.cpu_count().
+    chunksize (int): Sources per task; defaults to about four tasks per worker.
+
+    Yields:
+    tuple: (source, distances) in completion order. distances is a dict like dijkstra's result for a
+        dict graph, or a list indexed by dense node id like dijkstra_csr's result for a CSRGraph.
+    """
+    import os
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from DataStructures_Graphs import CSRGraph
+
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+    as_labels = csr is not graph
+    sources = list(sources)
+    dense_sources = [csr.index[source] for source in sources]
+    workers = max_workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(sources) // (workers * 4))
+
+    fd, path = tempfile.mkstemp(suffix=".csr")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            csr.offsets.tofile(f)
+            csr.targets.tofile(f)
+            csr.weights.tofile(f)
+        layout = (path, len(csr.offsets), len(csr.targets), csr.weights.typecode)
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_attach_csr, initargs=(layout,))
+        try:
+            futures = {
+                pool.submit(_dijkstra_chunk, dense_sources[start:start + chunksize]): start
+                for start in range(0, len(dense_sources), chunksize)
+            }
+            for future in as_completed(futures):
+                start = futures[future]
+                for offset, distances in enumerate(future.result()):
+                    yield sources[start + offset], csr.to_labels(distances) if as_labels else distances
+        finally:
+            # Also reached when the caller stops iterating early.
+            pool.shutdown(cancel_futures=True)
+    finally:
+        os.remove(path)
+
+# Worker-side state for dijkstra_many: memoryviews over the mapped CSR file.
+_shared_csr = None
+
+def _attach_csr(layout):
+    import mmap
+    from array import array
+
+    global _shared_csr
+    path, num_offsets, num_edges, weight_code = layout
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    int_size = array("q").itemsize
+    edges_start = num_offsets * int_size
+    weights_start = edges_start + num_edges * int_size
+    _shared_csr = (
+        view[:edges_start].cast("q"),
+        view[edges_start:weights_start].cast("q"),
+        view[weights_start:].cast(weight_code),
+    )
+
+def _dijkstra_chunk(dense_sources):
+    offsets, targets, weights = _shared_csr
+    return [_dijkstra_dense(offsets, targets, weights, source) for source in dense_sources]
+
+def reverse_adjacency(graph):
+    """
+    Reverses every edge of a graph in the dijkstra dict format.
+
+    Parameters:
+    graph (dict): A dictionary where keys are node identifiers and values are lists of tuples (neighbor, weight).
+
+    Returns:
+    dict: The same nodes with each (neighbor, weight) edge pointing the other way.
+    """
+    reverse = {node: [] for node in graph}
+    for node, edges in graph.items():
+        for neighbor, weight in edges:
+            reverse.setdefault(neighbor, []).append((node, weight))
+    return reverse
+
+def shortest_path(graph, src, dst, method="dijkstra", heuristic=None, reverse_graph=None, stats=None):
+    """
+    Point-to-point shortest path that stops as soon as the answer is known.
+
+    Parameters:
+    graph (dict): A dictionary where keys are node identifiers and values are lists of tuples (neighbor, weight).
+    src: The starting node identifier.
+    dst: The target node, or a set/frozenset of targets (the search stops once all of them are settled).
+    method (str): "dijkstra", "bidirectional" (searches from both ends; single target only) or
+        "astar" (single target only; needs heuristic).
+    heuristic (callable): heuristic(node, dst) -> lower bound on the remaining distance. It must be
+        consistent (never drop by more than an edge weight) for A* to return shortest paths.
+    reverse_graph (dict): Precomputed reverse_adjacency(graph) for "bidirectional"; built on demand otherwise.
+    stats (dict): If given, receives "settled", the number of nodes settled by the search.
+
+    Returns:
+    tuple: (distance, path) with path the list of nodes from src to dst, or (float('inf'), []) if dst is
+        unreachable. For a set of targets, a dict mapping each target to such a tuple.
+    """
+    multi = isinstance(dst, (set, frozenset))
+    if method == "dijkstra":
+        targets = dst if multi else (dst,)
+        dist, pred, settled = _settle_targets(graph, src, targets, None)
+    elif multi:
+        raise ValueError(f"method {method!r} supports a single target only")
+    elif method == "astar":
+        if heuristic is None:
+            raise ValueError("method 'astar' needs a heuristic")
+        dist, pred, settled = _settle_targets(graph, src, (dst,), lambda node: heuristic(node, dst))
+    elif method == "bidirectional":
+        if reverse_graph is None:
+            reverse_graph = reverse_adjacency(graph)
+        distance, path, settled = _bidirectional(graph, reverse_graph, src, dst)
+        if stats is not None:
+            stats["settled"] = settled
+        return distance, path
+    else:
+        raise ValueError(f"unknown method {method!r}")
+
+    if stats is not None:
+        stats["settled"] = settled
+    if multi:
+        return {target: _path_to(dist, pred, target) for target in dst}
+    return _path_to(dist, pred, dst)
+
+def _settle_targets(graph, src, targets, estimate):
+    """Dijkstra (or A* when estimate is given) from src until every target is settled."""
+    import heapq
+
+    remaining = set(targets)
+    dist = {src: 0}
+    pred = {src: None}
+    settled = set()
+    min_heap = [(estimate(src) if estimate else 0, src)]
+
+    while min_heap and remaining:
+        _, current_node = heapq.heappop(min_heap)
+
+        if current_node in settled:
+            continue
+        settled.add(current_node)
+        remaining.discard(current_node)
+        current_distance = dist[current_node]
+
+        for neighbor, weight in graph.get(current_node, ()):
+            distance = current_distance + weight
+
+            if distance < dist.get(neighbor, float('inf')):
+                dist[neighbor] = distance
+                pred[neighbor] = current_node
+                priority = distance + estimate(neighbor) if estimate else distance
+                heapq.heappush(min_heap, (priority, neighbor))
+
+    return dist, pred, len(settled)
+
+def _path_to(dist, pred, target):
+    if target not in dist:
+        return float('inf'), []
+    path = []
+    node = target
+    while node is not None:
+        path.append(node)
+        node = pred[node]
+    path.reverse()
+    return dist[target], path
+
+def _bidirectional(graph, reverse_graph, src, dst):
+    """Alternating Dijkstra from both ends; returns (distance, path, settled count)."""
+    import heapq
+
+    if src == dst:
+        return 0, [src], 1
+    graphs = (graph, reverse_graph)
+    dists = ({src: 0}, {dst: 0})
+    preds = ({src: None}, {dst: None})
+    settled = (set(), set())
+    heaps = ([(0, src)], [(0, dst)])
+    best, meeting = float('inf'), None
+
+    while heaps[0] and heaps[1]:
+        # No path through an unsettled node can beat the best meeting found.
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        current_distance, current_node = heapq.heappop(heaps[side])
+
+        if current_node in settled[side]:
+            continue
+        settled[side].add(current_node)
+        dist, other_dist, pred = dists[side], dists[1 - side], preds[side]
+
+        for neighbor, weight in graphs[side].get(current_node, ()):
+            distance = current_distance + weight
+
+            if distance < dist.get(neighbor, float('inf')):
+                dist[neighbor] = distance
+                pred[neighbor] = current_node
+                heapq.heappush(heaps[side], (distance, neighbor))
+
+                if neighbor in other_dist and distance + other_dist[neighbor] < best:
+                    best, meeting = distance + other_dist[neighbor], neighbor
+
+    count = len(settled[0]) + len(settled[1])
+    if meeting is None:
+        return float('inf'), [], count
+    _, path = _path_to(dists[0], preds[0], meeting)
+    node = preds[1][meeting]
+    while node is not None:
+        path.append(node)
+        node = preds[1][node]
+    return best, path, count
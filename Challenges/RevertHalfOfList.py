@@ -1,21 +1,18 @@
 import sys
 sys.path.append('..\\Algorithms')
-from DataStructures_Nodes import SingleLinkedListNode as ListNode
+from DataStructures_LinkedLists import LinkedList
 
 ListSize = int(sys.argv[1])
-LL = ListNode.fromIterable(list(range(1, ListSize + 1)))
+LL = LinkedList(range(1, ListSize + 1))
 
 print("Original List:")
-print(LL.strChain())
+print(LL)
 
-lastOfFirstHalf = LL.findNodeByIndex(ListSize // 2)
-lastOfSecondHalf = lastOfFirstHalf.Next()
-print("Last node of first half:", lastOfFirstHalf)
-print("First node of second half:", lastOfSecondHalf)
+secondHalf = LL.split_at(ListSize // 2)
+print("Last node of first half:", LL.tail)
+print("First node of second half:", secondHalf.head)
 
-headOfSecondHalf = lastOfSecondHalf.Revert()
-
-lastOfFirstHalf.Next(headOfSecondHalf)
-lastOfSecondHalf.Next(None)
+secondHalf.reverse()
+LL.concat(secondHalf)
 print("List with reversed second half:")
-print(LL.strChain())
\ No newline at end of file
+print(LL)
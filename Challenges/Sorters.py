@@ -1,3 +1,10 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # radixSort falls back to pure Python
+    np = None
 
 def selectorSort(arr):
     n = len(arr)
@@ -48,59 +55,258 @@ def bubbleSort(arr):
                 arr[j], arr[j+1] = arr[j+1], arr[j]
     return arr
 
-def heapSort(arr):
-    def heapify(arr, n, i):
-        largest = i
-        l = 2 * i + 1
-        r = 2 * i + 2
-
-        if l < n and arr[l] > arr[largest]:
-            largest = l
-
-        if r < n and arr[r] > arr[largest]:
-            largest = r
+def _heapSiftDown(keys, vals, index, size):
+    """Sift keys[index] down the min-heap keys[:size], mirroring moves on vals."""
+    key = keys[index]
+    val = vals[index] if vals is not None else None
+    child = 2 * index + 1
+    while child < size:
+        right = child + 1
+        if right < size and keys[right] < keys[child]:
+            child = right
+        child_key = keys[child]
+        if not child_key < key:
+            break
+        keys[index] = child_key
+        if vals is not None:
+            vals[index] = vals[child]
+        index = child
+        child = 2 * index + 1
+    keys[index] = key
+    if vals is not None:
+        vals[index] = val
 
-        if largest != i:
-            arr[i], arr[largest] = arr[largest], arr[i]
-            heapify(arr, n, largest)
+def heapSort(arr, key=None, partial=None):
+    """Iterative in-place heap sort (not stable); returns arr.
 
+    `key(x)` is evaluated once per element. With `partial=k` only the k
+    smallest elements are extracted, in O(n + k log n): afterwards
+    `arr[:k]` holds them in order and the rest of `arr` is unordered.
+    """
     n = len(arr)
+    k = n if partial is None else max(0, min(partial, n))
+    if k == 0:
+        return arr
+    if key is None:
+        keys, vals = arr, None
+    else:
+        keys, vals = [key(x) for x in arr], arr
 
     for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i)
+        _heapSiftDown(keys, vals, i, n)
 
-    for i in range(n-1, 0, -1):
-        arr[i], arr[0] = arr[0], arr[i]
-        heapify(arr, i, 0)
+    # Each extraction swaps the current minimum behind the shrinking heap,
+    # so the k smallest collect at the end in descending order.
+    for end in range(n - 1, n - 1 - k, -1):
+        keys[0], keys[end] = keys[end], keys[0]
+        if vals is not None:
+            vals[0], vals[end] = vals[end], vals[0]
+        _heapSiftDown(keys, vals, 0, end)
 
+    arr.reverse()
     return arr
 
+_SIGN_BIT = 1 << 63
+
 def radixSort(arr):
-    def countingSort(arr, exp):
-        n = len(arr)
-        output = [0] * n
-        count = [0] * 10
+    """Sort integers in place (negatives and arbitrarily wide ints allowed); returns arr.
+
+    With NumPy installed and values that fit in 64 bits, each pass is a
+    vectorized stable sort on one 16-bit digit; otherwise the pure-Python
+    path makes bucket passes over 8-bit digits.
+    """
+    if len(arr) == 0:
+        return arr
+    if np is not None:
+        try:
+            a = np.asarray(arr)
+        except OverflowError:
+            a = None
+        if a is not None and a.ndim == 1 and a.dtype.kind in "iu":
+            out = _radixSortNumpy(a)
+            if isinstance(arr, np.ndarray):
+                arr[:] = out
+            else:
+                _writeBack(arr, out.tolist())
+            return arr
+    _writeBack(arr, _radixSortPython(list(arr)))
+    return arr
+
+def _writeBack(arr, values):
+    """Replace the contents of arr in place, keeping its type (list or array.array)."""
+    if isinstance(arr, array):
+        arr[:] = array(arr.typecode, values)
+    else:
+        arr[:] = values
 
-        for i in range(n):
-            index = arr[i] // exp
-            count[index % 10] += 1
+def _radixSortNumpy(a):
+    """LSD radix sort of a 1-D integer array over 16-bit digits; returns a new array."""
+    signed = a.dtype.kind == "i"
+    if signed:
+        # Flipping the sign bit maps int64 order onto uint64 order.
+        u = a.astype(np.int64).view(np.uint64) ^ np.uint64(_SIGN_BIT)
+    else:
+        u = a.astype(np.uint64)
+    # Offsetting by the minimum skips the passes for digits above the span.
+    low = u.min()
+    u -= low
+    span = int(u.max())
+    shift = 0
+    while span >> shift:
+        digits = ((u >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(np.uint16)
+        counts = np.bincount(digits, minlength=1 << 16)
+        if counts.max() < len(u):
+            # Stable sort of 16-bit keys is itself a linear radix pass in NumPy.
+            u = u[np.argsort(digits, kind="stable")]
+        shift += 16
+    u += low
+    if signed:
+        return (u ^ np.uint64(_SIGN_BIT)).view(np.int64)
+    return u
 
-        for i in range(1, 10):
-            count[i] += count[i - 1]
+def _radixSortPython(values):
+    """LSD radix sort of a list of ints over 8-bit digits; returns a new list."""
+    low = min(values)
+    if low:
+        values = [v - low for v in values]
+    span = max(values)
+    shift = 0
+    while span >> shift:
+        buckets = [[] for _ in range(256)]
+        appends = [bucket.append for bucket in buckets]
+        for v in values:
+            appends[(v >> shift) & 255](v)
+        values = [v for bucket in buckets for v in bucket]
+        shift += 8
+    if low:
+        values = [v + low for v in values]
+    return values
 
-        for i in range(n - 1, -1, -1):
-            index = arr[i] // exp
-            output[count[index % 10] - 1] = arr[i]
-            count[index % 10] -= 1
+# Hybrid sort: a compact Timsort. Natural runs (strictly descending ones are
+# reversed) are extended to a minimum length with binary insertion sort and
+# then merged pairwise through one buffer allocated up front. When a key
+# function is given the keys are computed once into `keys` and every move is
+# mirrored on the values list `vals`; without one `keys` is the list itself
+# and `vals` is None.
 
-        for i in range(n):
-            arr[i] = output[i]
+def _minRun(n):
+    """Run length in [32, 64] such that n / minrun is close to a power of two."""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
 
-    max1 = max(arr)
+def _countRun(keys, vals, lo, n):
+    """Return the end of the natural run starting at lo, making it ascending."""
+    hi = lo + 1
+    if hi == n:
+        return hi
+    if keys[hi] < keys[lo]:
+        # Strictly descending only, so reversing it keeps the sort stable.
+        hi += 1
+        while hi < n and keys[hi] < keys[hi - 1]:
+            hi += 1
+        keys[lo:hi] = keys[lo:hi][::-1]
+        if vals is not None:
+            vals[lo:hi] = vals[lo:hi][::-1]
+    else:
+        while hi < n and not keys[hi] < keys[hi - 1]:
+            hi += 1
+    return hi
 
-    exp = 1
-    while max1 // exp > 0:
-        countingSort(arr, exp)
-        exp *= 10
+def _binaryInsertionSort(keys, vals, lo, start, hi):
+    """Sort keys[lo:hi] given that keys[lo:start] is already sorted."""
+    for i in range(start, hi):
+        k = keys[i]
+        pos = bisect_right(keys, k, lo, i)
+        if pos != i:
+            keys[pos + 1:i + 1] = keys[pos:i]
+            keys[pos] = k
+            if vals is not None:
+                v = vals[i]
+                vals[pos + 1:i + 1] = vals[pos:i]
+                vals[pos] = v
 
-    return arr
\ No newline at end of file
+def _mergeRuns(keys, vals, lo, mid, hi, buf_keys, buf_vals):
+    """Merge the adjacent sorted runs [lo, mid) and [mid, hi) in place."""
+    # Leading left items and trailing right items are already in place.
+    lo = bisect_right(keys, keys[mid], lo, mid)
+    if lo == mid:
+        return
+    hi = bisect_left(keys, keys[mid - 1], mid, hi)
+    n1 = mid - lo
+    buf_keys[:n1] = keys[lo:mid]
+    if vals is not None:
+        buf_vals[:n1] = vals[lo:mid]
+    i, j, k = 0, mid, lo
+    if vals is None:
+        while i < n1 and j < hi:
+            if keys[j] < buf_keys[i]:
+                keys[k] = keys[j]
+                j += 1
+            else:
+                keys[k] = buf_keys[i]
+                i += 1
+            k += 1
+    else:
+        while i < n1 and j < hi:
+            if keys[j] < buf_keys[i]:
+                keys[k] = keys[j]
+                vals[k] = vals[j]
+                j += 1
+            else:
+                keys[k] = buf_keys[i]
+                vals[k] = buf_vals[i]
+                i += 1
+            k += 1
+    # Whatever is left of the right run is already in place.
+    if i < n1:
+        keys[k:k + n1 - i] = buf_keys[i:n1]
+        if vals is not None:
+            vals[k:k + n1 - i] = buf_vals[i:n1]
+
+def hybridSort(arr, key=None, reverse=False):
+    """Stable adaptive sort of `arr` in place; returns `arr`.
+
+    Presorted or reversed data costs O(n) through run detection, otherwise
+    O(n log n) with `key(x)` evaluated once per element. `reverse=True`
+    sorts descending while keeping equal elements in their original order.
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    if reverse:
+        arr.reverse()
+    if key is None:
+        keys, vals = arr, None
+    else:
+        keys, vals = [key(x) for x in arr], arr
+
+    min_run = _minRun(n)
+    runs = [0]
+    lo = 0
+    while lo < n:
+        hi = _countRun(keys, vals, lo, n)
+        if hi - lo < min_run:
+            forced = min(n, lo + min_run)
+            _binaryInsertionSort(keys, vals, lo, hi, forced)
+            hi = forced
+        runs.append(hi)
+        lo = hi
+
+    buf_keys = [None] * n
+    buf_vals = [None] * n if vals is not None else None
+    # Merge neighbouring runs pairwise until a single run remains.
+    while len(runs) > 2:
+        merged = [0]
+        for r in range(2, len(runs), 2):
+            _mergeRuns(keys, vals, runs[r - 2], runs[r - 1], runs[r], buf_keys, buf_vals)
+            merged.append(runs[r])
+        if len(runs) % 2 == 0:
+            merged.append(runs[-1])
+        runs = merged
+
+    if reverse:
+        arr.reverse()
+    return arr